@@ -0,0 +1,48 @@
+from int_computer import Computer, Memory
+
+
+class Specialization:
+    # program run ahead on inputs known in advance, up to the first input it was not given
+
+    def __init__(self, tape, inputs):
+        computer = Computer()
+        computer.load(tape)
+        for value in inputs:
+            computer.inq.put_message(value)
+        computer.run()
+
+        self.length = len(tape.split(','))
+        self.outputs = list(computer.outq.q)
+        self.steps = computer.steps  # instructions every start skips
+        computer.outq.q.clear()
+        self.snapshot = computer.snapshot()
+
+    def start(self, inq=None, outq=None):
+        computer = Computer(inq=inq, outq=outq)
+        computer.restore(self.snapshot, queues=False)
+        for value in self.outputs:
+            computer.outq.put_message(value)
+        return computer
+
+    def residual(self):
+        # memory image to load, with pointer and relative base to start from instead of 0, 0
+        memory = self.snapshot.tape
+        end = self.length
+        for page_idx in memory.pages:
+            start = page_idx << Memory.PAGE_BITS
+            written = [a for a, value in enumerate(memory[start:start + Memory.PAGE_SIZE], start) if value != 0]
+            end = max([end] + [a + 1 for a in written])
+
+        tape = ",".join(str(value) for value in memory[0:end])
+        return tape, self.snapshot.pointer, self.snapshot.relative_base
+
+
+specializations = {}  # (image digest, input prefix) -> Specialization, live computers stay out of the disk cache
+
+
+def specialize(tape, inputs):
+    # computed once for every program and input prefix in this process
+    key = (Computer.registry.get(tape).digest, tuple(inputs))
+    if key not in specializations:
+        specializations[key] = Specialization(tape, inputs)
+    return specializations[key]
@@ -0,0 +1,303 @@
+from int_computer import Argument, Computer, OperationProvider
+from int_computer import Add, Mul, In, Out, JumpIfTrue, JumpIfFalse, LessThan, Equals, ChangeRelativeBase, Halt
+
+from collections import deque
+
+
+class Instruction:
+    MNEMONICS = {
+        Add: 'add',
+        Mul: 'mul',
+        In: 'in',
+        Out: 'out',
+        JumpIfTrue: 'jnz',
+        JumpIfFalse: 'jz',
+        LessThan: 'lt',
+        Equals: 'eq',
+        ChangeRelativeBase: 'arb',
+        Halt: 'halt',
+    }
+
+    def __init__(self, address, tape):
+        self.address = address
+        self.value = tape[address]
+
+        entry = None
+        if 0 <= self.value <= OperationProvider.MAX_OPCODE:
+            entry = OperationProvider.dispatch_table[self.value]
+        if entry is None:
+            raise Exception("unknown opcode:", self.value, "at", address)
+
+        self.operation_class, mode_digits = entry
+        self.modes = [Argument.modes[digit] for digit in mode_digits]
+        self.args = [tape[address + 1 + idx] for idx in range(self.operation_class.num_of_args)]
+        self.size = self.operation_class.num_of_args + 1
+        self.next = address + self.size
+
+    @property
+    def mnemonic(self):
+        return Instruction.MNEMONICS[self.operation_class]
+
+    def is_jump(self):
+        return self.operation_class in (JumpIfTrue, JumpIfFalse)
+
+    def constant(self, idx):
+        if self.modes[idx] == Argument.IMMEDIATE:
+            return self.args[idx]
+        return None
+
+    def jump_target(self):
+        return self.constant(1)
+
+    def jump_condition(self):
+        # True / False when the jump is always / never taken, None when it depends on memory
+        value = self.constant(0)
+        if value is None:
+            return None
+        return (value != 0) == (self.operation_class == JumpIfTrue)
+
+    def computed_constant(self):
+        # value written by add / mul of two immediates, how call sites push return addresses
+        if self.operation_class not in (Add, Mul):
+            return None
+        v1, v2 = self.constant(0), self.constant(1)
+        if v1 is None or v2 is None:
+            return None
+        return v1 + v2 if self.operation_class == Add else v1 * v2
+
+    def written_address(self):
+        if self.operation_class in (Add, Mul, LessThan, Equals):
+            idx = 2
+        elif self.operation_class == In:
+            idx = 0
+        else:
+            return None
+
+        if self.modes[idx] == Argument.POSITION:
+            return self.args[idx]
+        return None
+
+    def writes_relative(self):
+        written_arg = {Add: 2, Mul: 2, LessThan: 2, Equals: 2, In: 0}.get(self.operation_class)
+        return written_arg is not None and self.modes[written_arg] == Argument.RELATIVE
+
+    @staticmethod
+    def format_arg(value, mode):
+        if mode == Argument.IMMEDIATE:
+            return str(value)
+        if mode == Argument.RELATIVE:
+            return f"[rb{value:+d}]"
+        return f"[{value}]"
+
+    def __str__(self):
+        args = ", ".join(Instruction.format_arg(*arg) for arg in zip(self.args, self.modes))
+        return f"{self.address:>6}: {self.mnemonic:<5}{args}"
+
+    def __repr__(self):
+        return str(self)
+
+
+class BasicBlock:
+    def __init__(self, start):
+        self.start = start
+        self.instructions = []
+        self.successors = []  # (address, kind), kind is one of Program.EDGE_KINDS
+
+    @property
+    def end(self):
+        return self.instructions[-1].next
+
+    def __str__(self):
+        return f"block {self.start}-{self.end - 1}"
+
+    def __repr__(self):
+        return str(self)
+
+
+class Program:
+    FALLTHROUGH = 'fallthrough'
+    JUMP = 'jump'
+    CALL = 'call'
+    RETURN_SITE = 'return site'
+    EDGE_KINDS = [FALLTHROUGH, JUMP, CALL, RETURN_SITE]
+
+    def __init__(self, tape, entries=(0,)):
+        values = [int(x) for x in tape.split(',')] if isinstance(tape, str) else list(tape)
+        self.length = len(values)
+        # arguments of an instruction cut off by the end of the program read as 0, as in memory
+        self.tape = values + [0] * Computer.MAX_NUM_OF_ARGS
+        self.instructions = {}
+        self.leaders = set(entries)
+        self.calls = {}  # call site -> (callee, return address)
+        self.indirect = set()  # jumps with target read from memory, e.g. returns
+        self.bad = {}  # address -> reason it could not be decoded
+
+        self.trace(entries)
+        self.build_blocks()
+
+    def decode(self, address):
+        if address in self.instructions:
+            return self.instructions[address]
+        if not 0 <= address < self.length:
+            self.bad[address] = "outside of the program"
+            return None
+
+        try:
+            instruction = Instruction(address, self.tape)
+        except Exception as e:
+            self.bad[address] = str(e.args)
+            return None
+
+        self.instructions[address] = instruction
+        return instruction
+
+    def trace(self, entries):
+        # recursive descent from the entries, only following control flow known statically
+        to_visit = deque(entries)
+        previous = {}
+
+        while to_visit:
+            address = to_visit.popleft()
+            instruction = self.decode(address)
+            if instruction is None:
+                continue
+
+            for target in self.successors(instruction, previous.get(address)):
+                if target not in self.instructions and target not in self.bad:
+                    previous[target] = instruction
+                    to_visit.append(target)
+
+    def successors(self, instruction, previous):
+        if instruction.operation_class == Halt:
+            return []
+
+        if not instruction.is_jump():
+            return [instruction.next]
+
+        target = instruction.jump_target()
+        condition = instruction.jump_condition()
+        targets = []
+
+        if target is None:
+            self.indirect.add(instruction.address)
+        else:
+            self.leaders.add(target)
+            if condition is not False:
+                targets.append(target)
+
+        if condition is not True:
+            targets.append(instruction.next)
+            self.leaders.add(instruction.next)
+
+        # call idiom: push constant return address at [rb+x], then jump there unconditionally
+        if previous is not None and condition is True and target is not None:
+            return_address = previous.computed_constant()
+            if previous.writes_relative() and return_address is not None:
+                self.calls[instruction.address] = (target, return_address)
+                self.leaders.add(return_address)
+                targets.append(return_address)
+
+        return targets
+
+    def build_blocks(self):
+        self.blocks = {}
+        block = None
+
+        for address in sorted(self.instructions):
+            instruction = self.instructions[address]
+            if block is None or address in self.leaders or address != block.end:
+                block = BasicBlock(address)
+                self.blocks[address] = block
+
+            block.instructions.append(instruction)
+
+            if instruction.is_jump() or instruction.operation_class == Halt:
+                block = None
+
+        for block in self.blocks.values():
+            last = block.instructions[-1]
+            if last.operation_class == Halt:
+                continue
+
+            if not last.is_jump():
+                if block.end in self.blocks:
+                    block.successors.append((block.end, Program.FALLTHROUGH))
+                continue
+
+            condition = last.jump_condition()
+            target = last.jump_target()
+
+            if last.address in self.calls:
+                callee, return_address = self.calls[last.address]
+                block.successors.append((callee, Program.CALL))
+                block.successors.append((return_address, Program.RETURN_SITE))
+                continue
+
+            if target is not None and condition is not False:
+                block.successors.append((target, Program.JUMP))
+            if condition is not True:
+                block.successors.append((last.next, Program.FALLTHROUGH))
+
+    def is_return(self, instruction):
+        # return idiom: unconditional jump to the address the caller pushed at [rb+x]
+        return instruction.jump_condition() is True and instruction.modes[1] == Argument.RELATIVE
+
+    def code_addresses(self):
+        return {a for i in self.instructions.values() for a in range(i.address, i.next)}
+
+    def self_modifying(self):
+        # instructions writing to a constant address which holds code, or an opcode only valid once patched
+        code = self.code_addresses() | self.bad.keys()
+        return [i for i in self.instructions.values() if i.written_address() in code]
+
+    def listing(self):
+        lines = []
+        modifying = {i.address for i in self.self_modifying()}
+
+        for block in sorted(self.blocks.values(), key=lambda b: b.start):
+            successors = ", ".join(f"{kind} {address}" for address, kind in block.successors)
+            lines.append(f"{block} -> {successors or 'none'}")
+            for instruction in block.instructions:
+                note = "  ; writes code" if instruction.address in modifying else ""
+                if instruction.address in self.indirect:
+                    note += "  ; return" if self.is_return(instruction) else "  ; indirect jump"
+                lines.append(f"  {instruction}{note}")
+
+        return "\n".join(lines)
+
+    def to_dict(self):
+        return {
+            'blocks': [{
+                'start': block.start,
+                'end': block.end,
+                'instructions': [i.address for i in block.instructions],
+                'successors': [[address, kind] for address, kind in block.successors],
+            } for block in sorted(self.blocks.values(), key=lambda b: b.start)],
+            'calls': [[site, callee, return_address] for site, (callee, return_address) in sorted(self.calls.items())],
+            'indirect': sorted(self.indirect),
+            'self_modifying': sorted(i.address for i in self.self_modifying()),
+            'bad': {str(address): reason for address, reason in sorted(self.bad.items())},
+        }
+
+    def to_dot(self):
+        styles = {
+            Program.FALLTHROUGH: 'solid',
+            Program.JUMP: 'bold',
+            Program.CALL: 'dashed',
+            Program.RETURN_SITE: 'dotted',
+        }
+        lines = ["digraph intcode {", "  node [shape=box, fontname=monospace];"]
+
+        for block in sorted(self.blocks.values(), key=lambda b: b.start):
+            label = "\\l".join(str(i) for i in block.instructions) + "\\l"
+            lines.append(f'  b{block.start} [label="{label}"];')
+            for address, kind in block.successors:
+                lines.append(f'  b{block.start} -> b{address} [style={styles[kind]}, label="{kind}"];')
+
+        lines.append("}")
+        return "\n".join(lines)
+
+
+def program_cfg(tape):
+    # cfg as plain data, computed once per program and kept by the registry
+    return Computer.registry.get(tape).analysis('cfg', lambda values: Program(values).to_dict())
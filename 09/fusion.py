@@ -0,0 +1,135 @@
+from int_computer import Computer, Memory, OperationProvider
+from int_computer import Add, Mul, JumpIfTrue, JumpIfFalse, LessThan, Equals, ChangeRelativeBase
+from disassembler import Program
+from jit import BlockCompiler
+
+
+class FusedOperation:
+    # run of straight line instructions, optionally ending with a jump, compiled into one handler
+    STRAIGHT = (Add, Mul, LessThan, Equals, ChangeRelativeBase)
+    JUMPS = (JumpIfTrue, JumpIfFalse)
+
+    MAX_LENGTH = 8
+
+    def __init__(self, start, operations, tape):
+        self.start = start
+        self.operations = operations
+        self.length = len(operations)
+        self.handler, self.addresses = BlockCompiler(start, tape, max_length=self.length).compile()
+
+        if self.handler is None or self.handler.length != self.length:
+            raise Exception("Fusion site does not compile", start)
+
+    def covered(self):
+        return self.addresses
+
+    def execute(self, computer):
+        # a write into decoded code makes the handler return early, right after the instruction that did it
+        computer.pointer, computer.relative_base, executed = self.handler(computer, computer.tape, computer.relative_base)
+        return executed
+
+    def __str__(self):
+        names = " + ".join(type(operation).__name__ for operation in self.operations)
+        return f"{self.start}: {names}"
+
+    def __repr__(self):
+        return str(self)
+
+
+def fusion_sites(tape):
+    # static pass over reachable code, runs never cross a basic block boundary
+    program = Program(tape)
+    sites = []
+
+    for block in program.blocks.values():
+        run = []
+        for instruction in block.instructions + [None]:
+            if instruction is not None and instruction.operation_class in FusedOperation.STRAIGHT:
+                run.append(instruction.address)
+                if len(run) < FusedOperation.MAX_LENGTH:
+                    continue
+            elif instruction is not None and instruction.operation_class in FusedOperation.JUMPS and run:
+                # compare and branch, counter update and branch, ...
+                run.append(instruction.address)
+
+            if len(run) >= 2:
+                sites.append(run)
+            run = []
+
+    return sites
+
+
+compiled = {}  # image digest -> start -> FusedOperation, handlers hold no state so computers share them
+
+
+def fuse(tape):
+    # sites are kept with the program image, compiled handlers only for this process since they do not pickle
+    image = Computer.registry.get(tape)
+    if image.digest not in compiled:
+        sites = image.analysis('fusion_sites', fusion_sites)
+        memory = image.memory(Memory)
+        compiled[image.digest] = {
+            site[0]: FusedOperation(site[0], [OperationProvider.get_next(a, memory) for a in site], memory)
+            for site in sites
+        }
+    return dict(compiled[image.digest])
+
+
+class FusingComputer(Computer):
+
+    def __init__(self, inq=None, outq=None, input_provider=None, profiler=None):
+        super().__init__(inq=inq, outq=outq, input_provider=input_provider, profiler=profiler)
+        self.fused = {}
+        self.fused_starts = {}  # address -> starts of fused operations covering it
+        self.dispatches = 0
+
+    def load(self, tape):
+        super().load(tape)
+        self.fused = fuse(tape)
+        self.fused_starts = {}
+
+        for start, operation in self.fused.items():
+            for address in operation.covered():
+                self.fused_starts.setdefault(address, set()).add(start)
+            # writes there have to reach invalidate
+            self.decoded_addresses.update(operation.covered())
+
+    def restore(self, snapshot, queues=True):
+        super().restore(snapshot, queues=queues)
+        # fused operations are built from the loaded image, they are not worth carrying over
+        self.fused = {}
+        self.fused_starts = {}
+
+    def invalidate(self, address):
+        super().invalidate(address)
+
+        for start in self.fused_starts.pop(address, ()):
+            self.fused.pop(start, None)
+
+    def execute(self, max_steps=None, v=False):
+        # handlers access list pages directly, bypassing the journal
+        if v or self.journal is not None or type(self.tape) is not Memory:
+            return super().execute(max_steps, v=v)
+
+        steps = 0
+        budget = max_steps if max_steps is not None else float('inf')
+        fused = self.fused
+
+        while self.state == Computer.RUNNING:
+            if steps == max_steps:
+                self.pause(Computer.BUDGET)
+                break
+
+            self.dispatches += 1
+            operation = fused.get(self.pointer)
+            if operation is not None and steps + operation.length <= budget:
+                steps += operation.execute(self)
+                continue
+
+            operation = self.get_operation()
+            operation.execute(self)
+            steps += 1
+
+        # input which paused the computer was not executed
+        self.dispatches -= self.stop_reason == Computer.NEED_INPUT
+        return steps
@@ -0,0 +1,33 @@
+from int_computer import Computer
+from fusion import FusingComputer, fuse
+from tapes import INPUTS, day_tapes, run
+
+import time
+
+
+def report():
+    print(f"{'day':>4} {'fused':>6} {'instructions':>13} {'dispatches':>11} {'reduction':>10} {'plain':>8} {'fused':>8}")
+
+    for day, tape in day_tapes():
+        inputs = INPUTS.get(day, [])
+        fuse(tape)  # compiling the handlers is not part of the run
+
+        start = time.perf_counter()
+        plain, expected = run(Computer(), tape, inputs)
+        plain_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fusing, outputs = run(FusingComputer(), tape, inputs)
+        fused_time = time.perf_counter() - start
+
+        if outputs != expected or fusing.steps != plain.steps:
+            raise Exception("Fused run differs on day", day)
+
+        reduction = 1 - fusing.dispatches / max(fusing.steps, 1)
+        print(
+            f"{day:>4} {len(fuse(tape)):>6} {fusing.steps:>13} {fusing.dispatches:>11} {100 * reduction:9.1f}%"
+            f" {1000 * plain_time:6.1f}ms {1000 * fused_time:6.1f}ms"
+        )
+
+
+report()
@@ -0,0 +1,291 @@
+from int_computer import Computer, Argument, Memory, OperationProvider
+from int_computer import Add, Mul, Out, JumpIfTrue, JumpIfFalse, LessThan, Equals, ChangeRelativeBase
+
+
+class BlockCompiler:
+    # operations which can be compiled into a block, jumps and Out end the block
+    STRAIGHT = (Add, Mul, LessThan, Equals, ChangeRelativeBase)
+    TERMINATORS = (Out, JumpIfTrue, JumpIfFalse)
+
+    MAX_BLOCK_SIZE = 256
+
+    def __init__(self, start, tape, max_length=None):
+        self.start = start
+        self.tape = tape
+        self.max_length = max_length  # instructions, the block ends after that many even without a terminator
+        self.lines = []
+        self.temp_idx = 0
+        self.stored = {}  # constant address -> temp holding the value written there in this block
+        self.known = {}  # constant address -> value written there in this block when known while compiling
+        self.length = 0
+
+    def new_temp(self):
+        self.temp_idx += 1
+        return f"t{self.temp_idx}"
+
+    def emit(self, line):
+        self.lines.append("    " + line)
+
+    def constant(self, arg):
+        if arg.mode == Argument.IMMEDIATE:
+            return arg.value
+        if arg.mode == Argument.POSITION:
+            return self.known.get(arg.value)
+        return None
+
+    def read(self, arg):
+        if arg.mode == Argument.IMMEDIATE:
+            return str(arg.value)
+
+        if arg.mode == Argument.POSITION and arg.value in self.stored:
+            return self.stored[arg.value]
+
+        if arg.mode == Argument.POSITION and arg.value >= 0:
+            # address known while compiling, page index and offset are folded
+            page_idx = arg.value >> Memory.PAGE_BITS
+            offset = arg.value & Memory.PAGE_MASK
+            return f"(p[{offset}] if (p := pages.get({page_idx})) is not None else mem[{arg.value}])"
+
+        address = self.address(arg)
+        return f"(p[{address} & {Memory.PAGE_MASK}] if (p := pages.get({address} >> {Memory.PAGE_BITS})) is not None else mem[{address}])"
+
+    def address(self, arg):
+        if arg.mode == Argument.POSITION:
+            return str(arg.value)
+
+        temp = self.new_temp()
+        self.emit(f"{temp} = rb + {arg.value}")
+        return temp
+
+    def write(self, arg, value, next_pointer):
+        if arg.mode == Argument.POSITION and arg.value >= 0:
+            address = str(arg.value)
+            page_idx = arg.value >> Memory.PAGE_BITS
+            offset = arg.value & Memory.PAGE_MASK
+            self.stored[arg.value] = str(value)
+            if isinstance(value, int):
+                self.known[arg.value] = value
+            else:
+                self.known.pop(arg.value, None)
+        else:
+            address = self.address(arg)
+            page_idx = f"{address} >> {Memory.PAGE_BITS}"
+            offset = f"{address} & {Memory.PAGE_MASK}"
+            # may alias any constant address
+            self.stored = {}
+            self.known = {}
+
+        self.emit(f"q = pages.get({page_idx})")
+        # first write to a page since mark_clean goes through mem so the page is recorded as dirty
+        self.emit(f"if q is None or shared or ({page_idx}) not in dirty:")
+        self.emit(f"    mem[{address}] = {value}")
+        self.emit("else:")
+        self.emit(f"    q[{offset}] = {value}")
+        # program wrote into decoded code, leave the block so nothing stale runs
+        self.emit(f"if {address} in code:")
+        self.emit(f"    computer.invalidate({address})")
+        self.emit(f"    return {next_pointer}, rb, {self.length}")
+
+    def compile_operation(self, operation, next_pointer):
+        # address to keep compiling at, None when the block ends here
+        if isinstance(operation, ChangeRelativeBase):
+            self.emit(f"rb += {self.read(operation.args[0])}")
+            return next_pointer
+
+        if isinstance(operation, Out):
+            self.emit(f"computer.write({self.read(operation.args[0])})")
+            self.emit(f"return {next_pointer}, rb, {self.length}")
+            return None
+
+        if isinstance(operation, (JumpIfTrue, JumpIfFalse)):
+            value = self.constant(operation.args[0])
+            if value is not None:
+                if (value != 0) != isinstance(operation, JumpIfTrue):
+                    return next_pointer
+                # always taken, a target known while compiling is followed in the same block
+                target = self.constant(operation.args[1])
+                if target is not None:
+                    return target
+                self.emit(f"return {self.read(operation.args[1])}, rb, {self.length}")
+                return None
+
+            condition = "!=" if isinstance(operation, JumpIfTrue) else "=="
+            value = self.read(operation.args[0])
+            target = self.read(operation.args[1])
+            self.emit(f"if {value} {condition} 0:")
+            self.emit(f"    return {target}, rb, {self.length}")
+            self.emit(f"return {next_pointer}, rb, {self.length}")
+            return None
+
+        c1 = self.constant(operation.args[0])
+        c2 = self.constant(operation.args[1])
+
+        if c1 is not None and c2 is not None:
+            if isinstance(operation, Add):
+                value = c1 + c2
+            elif isinstance(operation, Mul):
+                value = c1 * c2
+            elif isinstance(operation, LessThan):
+                value = 1 if c1 < c2 else 0
+            else:
+                value = 1 if c1 == c2 else 0
+            self.write(operation.args[2], value, next_pointer)
+            return next_pointer
+
+        v1 = self.read(operation.args[0])
+        v2 = self.read(operation.args[1])
+
+        if isinstance(operation, Add):
+            expression = f"{v1} + {v2}"
+        elif isinstance(operation, Mul):
+            expression = f"{v1} * {v2}"
+        elif isinstance(operation, LessThan):
+            expression = f"1 if {v1} < {v2} else 0"
+        else:
+            expression = f"1 if {v1} == {v2} else 0"
+
+        value = self.new_temp()
+        self.emit(f"{value} = {expression}")
+        self.write(operation.args[2], value, next_pointer)
+        return next_pointer
+
+    def compile(self):
+        pointer = self.start
+        covered = []
+        starts = set()
+
+        while len(covered) < BlockCompiler.MAX_BLOCK_SIZE and self.length != self.max_length:
+            if pointer in starts:
+                # followed a jump back into this block, the next run starts there
+                break
+
+            try:
+                operation = OperationProvider.get_next(pointer, self.tape)
+            except Exception:
+                break
+
+            if not isinstance(operation, BlockCompiler.STRAIGHT + BlockCompiler.TERMINATORS):
+                break
+
+            starts.add(pointer)
+            next_pointer = pointer + operation.num_of_args + 1
+            covered += range(pointer, next_pointer)
+            self.length += 1
+            pointer = self.compile_operation(operation, next_pointer)
+
+            if pointer is None:
+                break
+
+        if not self.length:
+            return None, covered
+
+        if pointer is not None:
+            self.emit(f"return {pointer}, rb, {self.length}")
+
+        source = "\n".join([
+            "def block(computer, mem, rb):",
+            "    pages = mem.pages",
+            "    shared = mem.shared",
+            "    dirty = mem.dirty",
+            "    code = computer.decoded_addresses",
+        ] + self.lines)
+
+        namespace = {}
+        exec(source, namespace)
+        block = namespace['block']
+        block.source = source
+        block.length = self.length
+
+        return block, covered
+
+
+class JitComputer(Computer):
+    HOT_THRESHOLD = 16
+
+    def __init__(self, inq=None, outq=None, input_provider=None, profiler=None):
+        super().__init__(inq=inq, outq=outq, input_provider=input_provider, profiler=profiler)
+        self.reset_blocks()
+
+    def reset_blocks(self):
+        self.blocks = {}
+        self.block_starts = {}  # address -> starts of compiled blocks covering it
+        self.counts = {}
+        self.cold = set()
+
+    def load(self, tape):
+        super().load(tape)
+        self.reset_blocks()
+
+    def restore(self, snapshot, queues=True):
+        super().restore(snapshot, queues=queues)
+        self.reset_blocks()
+
+    def invalidate(self, address):
+        super().invalidate(address)
+
+        for start in self.block_starts.pop(address, ()):
+            if self.blocks.pop(start, None) is not None:
+                # code rewriting itself would be recompiled over and over, interpret it from now on
+                self.cold.add(start)
+
+    def compile_block(self, start):
+        block, covered = BlockCompiler(start, self.tape).compile()
+        if block is None:
+            self.cold.add(start)
+            return
+
+        self.blocks[start] = block
+        for address in covered:
+            self.block_starts.setdefault(address, set()).add(start)
+        self.decoded_addresses.update(covered)
+
+    def run(self, v=False, max_steps=None, max_outputs=None):
+        # compiled blocks access list pages directly, bypassing the journal
+        if v or self.profiler is not None or self.journal is not None or type(self.tape) is not Memory:
+            return super().run(v=v, max_steps=max_steps, max_outputs=max_outputs)
+
+        self.state = Computer.RUNNING
+        self.outputs_left = max_outputs or -1
+        steps = 0
+        budget = max_steps if max_steps is not None else float('inf')
+
+        blocks = self.blocks
+        counts = self.counts
+        cold = self.cold
+
+        while self.state == Computer.RUNNING:
+            if steps == max_steps:
+                self.pause(Computer.BUDGET)
+                break
+
+            block = blocks.get(self.pointer)
+            # a block runs as a whole, near the end of the budget single instructions are interpreted
+            if block is not None and steps + block.length <= budget:
+                # blocks run back to back while the next one is compiled too, pointer and base stay local
+                tape = self.tape
+                pointer, rb = self.pointer, self.relative_base
+                while True:
+                    pointer, rb, length = block(self, tape, rb)
+                    steps += length
+                    block = blocks.get(pointer)
+                    if block is None or steps + block.length > budget or self.state != Computer.RUNNING:
+                        break
+                self.pointer, self.relative_base = pointer, rb
+                continue
+
+            if self.pointer not in cold:
+                count = counts.get(self.pointer, 0) + 1
+                counts[self.pointer] = count
+                if count >= JitComputer.HOT_THRESHOLD and block is None:
+                    self.compile_block(self.pointer)
+                    continue
+
+            operation = self.get_operation()
+            operation.execute(self)
+            steps += 1
+
+        # input which paused the computer was not executed
+        self.steps += steps - (self.stop_reason == Computer.NEED_INPUT)
+        self.outputs_left = -1
+
+        return self.stop_reason
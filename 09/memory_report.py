@@ -0,0 +1,52 @@
+from int_computer import Computer, Memory, ArrayMemory
+from tapes import INPUTS, day_tapes, run
+
+import sys
+import time
+
+
+def tape_bytes(memory):
+    size = sys.getsizeof(memory.pages)
+    for page in memory.pages.values():
+        size += sys.getsizeof(page)
+        if isinstance(page, list):
+            # small ints are shared by the interpreter, everything else is a separate object
+            size += sum(sys.getsizeof(value) for value in page if not -5 <= value <= 256)
+
+    big = getattr(memory, 'big', {})
+    return size + sys.getsizeof(big) + sum(sys.getsizeof(value) for value in big.values())
+
+
+def measure(memory_class, tape, inputs, repeats=3):
+    best = None
+    for _ in range(repeats):
+        computer = Computer()
+        computer.memory_class = memory_class
+
+        start = time.perf_counter()
+        computer, outputs = run(computer, tape, inputs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return computer, outputs, best
+
+
+def report():
+    print(f"{'day':>4} {'instructions':>13} {'list KiB':>9} {'array KiB':>10} {'list ins/s':>11} {'array ins/s':>12}")
+
+    for day, tape in day_tapes():
+        inputs = INPUTS.get(day, [])
+        lists, expected, list_time = measure(Memory, tape, inputs)
+        arrays, outputs, array_time = measure(ArrayMemory, tape, inputs)
+
+        if outputs != expected or arrays.steps != lists.steps:
+            raise Exception("Array backed run differs on day", day)
+
+        steps = lists.steps
+        print(
+            f"{day:>4} {steps:>13} {tape_bytes(lists.tape) / 1024:9.1f} {tape_bytes(arrays.tape) / 1024:10.1f}"
+            f" {int(steps / list_time):>11} {int(steps / array_time):>12}"
+        )
+
+
+report()
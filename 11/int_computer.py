@@ -1,15 +1,20 @@
+from array import array
 from collections import deque
 
+import hashlib
+import os
+import pickle
+
 
 class Argument:
-    POSITION = 'POSITION'
-    IMMEDIATE = 'IMMEDIATE'
-    RELATIVE = 'RELATIVE'
+    POSITION = 0
+    IMMEDIATE = 1
+    RELATIVE = 2
 
     modes = {
-        '0': POSITION,
-        '1': IMMEDIATE,
-        '2': RELATIVE
+        0: POSITION,
+        1: IMMEDIATE,
+        2: RELATIVE
     }
 
     def __init__(self, value, mode):
@@ -22,7 +27,28 @@ class Argument:
         elif self.mode == Argument.RELATIVE:
             return self.value + computer.relative_base
 
-        raise Exception("get_address with mode", self.mode)
+        Argument.no_address(self.mode)
+
+    @staticmethod
+    def no_address(mode):
+        raise Exception("get_address with mode", mode)
+
+    @staticmethod
+    def value_source(mode, offset):
+        # python expression reading the argument at pointer p + offset, as handlers are generated
+        if mode == Argument.POSITION:
+            return f"tape[tape[p + {offset}]]"
+        if mode == Argument.IMMEDIATE:
+            return f"tape[p + {offset}]"
+        return f"tape[tape[p + {offset}] + computer.relative_base]"
+
+    @staticmethod
+    def address_source(mode, offset):
+        if mode == Argument.POSITION:
+            return f"tape[p + {offset}]"
+        if mode == Argument.RELATIVE:
+            return f"tape[p + {offset}] + computer.relative_base"
+        return f"Argument.no_address({mode})"
 
     def get_value(self, computer):
         tape = computer.tape
@@ -42,12 +68,34 @@ class Argument:
 
 class Operation:
     num_of_args = None
-
-    def __init__(self, arg_description, args):
-        description = str(''.join(reversed(arg_description))) + "0" * \
-            (len(args)-len(arg_description))
-
-        self.args = [Argument(*arg) for arg in zip(args, description)]
+    # body of the handler generated for every combination of modes,
+    # {v0} is the value of the first argument, {a2} the address in the third one, {next} the following pointer
+    template = None
+
+    def __init__(self, modes, args):
+        self.args = [Argument(*arg) for arg in zip(args, modes)]
+
+    @classmethod
+    def handler(cls, modes):
+        # shared by every address holding this opcode, arguments are read from the tape when it runs
+        fields = {'next': f"p + {cls.num_of_args + 1}"}
+        for idx, mode in enumerate(modes):
+            fields[f"v{idx}"] = Argument.value_source(mode, idx + 1)
+            fields[f"a{idx}"] = Argument.address_source(mode, idx + 1)
+
+        body = cls.template.format(**fields).split("\n")
+        source = "\n".join([
+            "def execute(computer):",
+            "    tape = computer.tape",
+            "    p = computer.pointer",
+        ] + ["    " + line for line in body])
+
+        namespace = {'Argument': Argument}
+        exec(source, namespace)
+
+        operation = cls(modes, [])
+        operation.execute = namespace['execute']
+        return operation
 
     def get_value(self, arg_idx, computer):
         arg = self.args[arg_idx]
@@ -64,30 +112,33 @@ class Operation:
 class Add(Operation):
     opcode = 1
     num_of_args = 3
+    template = "v1 = {v0}\nv2 = {v1}\ncomputer.store({a2}, v1 + v2)\ncomputer.pointer = {next}"
 
     def execute(self, computer):
         v1 = self.get_value(0, computer)
         v2 = self.get_value(1, computer)
         res_address = self.get_address(2, computer)
-        computer.tape[res_address] = v1 + v2
+        computer.store(res_address, v1 + v2)
         self.shift_pointer(computer)
 
 
 class Mul(Operation):
     opcode = 2
     num_of_args = 3
+    template = "v1 = {v0}\nv2 = {v1}\ncomputer.store({a2}, v1 * v2)\ncomputer.pointer = {next}"
 
     def execute(self, computer):
         v1 = self.get_value(0, computer)
         v2 = self.get_value(1, computer)
         res_address = self.get_address(2, computer)
-        computer.tape[res_address] = v1 * v2
+        computer.store(res_address, v1 * v2)
         self.shift_pointer(computer)
 
 
 class In(Operation):
     opcode = 3
     num_of_args = 1
+    template = "res_address = {a0}\nif not computer.can_read():\n    computer.pause()\n    return\ncomputer.store(res_address, computer.read())\ncomputer.pointer = {next}"
 
     def execute(self, computer):
         res_address = self.get_address(0, computer)
@@ -95,13 +146,14 @@ class In(Operation):
         if should_pause:
             computer.pause()
             return
-        computer.tape[res_address] = computer.read()
+        computer.store(res_address, computer.read())
         self.shift_pointer(computer)
 
 
 class Out(Operation):
     opcode = 4
     num_of_args = 1
+    template = "computer.write({v0})\ncomputer.pointer = {next}"
 
     def execute(self, computer):
         v = self.get_value(0, computer)
@@ -112,6 +164,7 @@ class Out(Operation):
 class JumpIfTrue(Operation):
     opcode = 5
     num_of_args = 2
+    template = "v1 = {v0}\nv2 = {v1}\ncomputer.pointer = v2 if v1 != 0 else {next}"
 
     def execute(self, computer):
         v1 = self.get_value(0, computer)
@@ -124,6 +177,7 @@ class JumpIfTrue(Operation):
 class JumpIfFalse(Operation):
     opcode = 6
     num_of_args = 2
+    template = "v1 = {v0}\nv2 = {v1}\ncomputer.pointer = v2 if v1 == 0 else {next}"
 
     def execute(self, computer):
         v1 = self.get_value(0, computer)
@@ -136,30 +190,33 @@ class JumpIfFalse(Operation):
 class LessThan(Operation):
     opcode = 7
     num_of_args = 3
+    template = "v1 = {v0}\nv2 = {v1}\ncomputer.store({a2}, int(v1 < v2))\ncomputer.pointer = {next}"
 
     def execute(self, computer):
         v1 = self.get_value(0, computer)
         v2 = self.get_value(1, computer)
         res_address = self.get_address(2, computer)
-        computer.tape[res_address] = int(v1 < v2)
+        computer.store(res_address, int(v1 < v2))
         self.shift_pointer(computer)
 
 
 class Equals(Operation):
     opcode = 8
     num_of_args = 3
+    template = "v1 = {v0}\nv2 = {v1}\ncomputer.store({a2}, int(v1 == v2))\ncomputer.pointer = {next}"
 
     def execute(self, computer):
         v1 = self.get_value(0, computer)
         v2 = self.get_value(1, computer)
         res_address = self.get_address(2, computer)
-        computer.tape[res_address] = int(v1 == v2)
+        computer.store(res_address, int(v1 == v2))
         self.shift_pointer(computer)
 
 
 class ChangeRelativeBase(Operation):
     opcode = 9
     num_of_args = 1
+    template = "v = {v0}\ncomputer.pointer = {next}\ncomputer.add_to_relative_base(v)"
 
     def execute(self, computer):
         v = self.get_value(0, computer)
@@ -170,6 +227,7 @@ class ChangeRelativeBase(Operation):
 class Halt(Operation):
     opcode = 99
     num_of_args = 0
+    template = "computer.halt()"
 
     def execute(self, computer):
         computer.halt()
@@ -178,6 +236,8 @@ class Halt(Operation):
 class OperationProvider:
     operations = [Add, Mul, In, Out, Halt, JumpIfTrue, JumpIfFalse, LessThan, Equals, ChangeRelativeBase]
 
+    MAX_OPCODE = 22299
+
     @staticmethod
     def operation_class_by_opcode(opcode):
         for op in OperationProvider.operations:
@@ -186,19 +246,291 @@ class OperationProvider:
 
         raise Exception("unknown opcode:", opcode)
 
+    @staticmethod
+    def build_dispatch_table():
+        by_opcode = {op.opcode: op for op in OperationProvider.operations}
+        table = [None] * (OperationProvider.MAX_OPCODE + 1)
+
+        for value in range(len(table)):
+            operation_class = by_opcode.get(value % 100)
+            if operation_class is None:
+                continue
+
+            modes = (value // 100 % 10, value // 1000 % 10, value // 10000 % 10)
+            modes = modes[:operation_class.num_of_args]
+            if any(mode not in Argument.modes for mode in modes):
+                continue
+
+            table[value] = (operation_class, modes)
+
+        return table
+
+    @staticmethod
+    def build_handlers(table):
+        handlers = [None] * len(table)
+        shared = {}
+
+        for value, entry in enumerate(table):
+            if entry is not None:
+                if entry not in shared:
+                    shared[entry] = entry[0].handler(entry[1])
+                handlers[value] = shared[entry]
+
+        return handlers
+
     @staticmethod
     def get_next(pointer, tape):
-        description = str(tape[pointer])
-        opcode = int(description[-2:])
-        args_description = description[:-2]
-        operation_class = OperationProvider.operation_class_by_opcode(opcode)
+        value = tape[pointer]
+        entry = None
+        if 0 <= value <= OperationProvider.MAX_OPCODE:
+            entry = OperationProvider.dispatch_table[value]
+        if entry is None:
+            raise Exception("unknown opcode:", value)
 
-        operation = operation_class(
-            args_description,
-            tape[pointer+1: pointer+1+operation_class.num_of_args]
-        )
+        operation_class, modes = entry
+        args = [tape[pointer + 1 + idx] for idx in range(operation_class.num_of_args)]
 
-        return operation
+        return operation_class(modes, args)
+
+    @staticmethod
+    def get_handler(pointer, tape):
+        # what the interpreter runs, nothing is allocated; get_next gives the arguments to tools which look at them
+        value = tape[pointer]
+        handler = None
+        if 0 <= value <= OperationProvider.MAX_OPCODE:
+            handler = OperationProvider.handlers[value]
+        if handler is None:
+            raise Exception("unknown opcode:", value)
+        return handler
+
+
+OperationProvider.dispatch_table = OperationProvider.build_dispatch_table()
+OperationProvider.handlers = OperationProvider.build_handlers(OperationProvider.dispatch_table)
+
+
+class Memory:
+    PAGE_BITS = 10
+    PAGE_SIZE = 1 << PAGE_BITS
+    PAGE_MASK = PAGE_SIZE - 1
+
+    def __init__(self, values=()):
+        self.pages = {}
+        self.shared = set()  # pages used also by some fork, copied before first write
+
+        values = list(values)
+        for start in range(0, len(values), Memory.PAGE_SIZE):
+            page = values[start:start + Memory.PAGE_SIZE]
+            page += [0] * (Memory.PAGE_SIZE - len(page))
+            self.pages[start >> Memory.PAGE_BITS] = page
+
+        self.dirty = set(self.pages)  # pages written since the last mark_clean
+        self.peak_pages = len(self.pages)
+
+    def __getitem__(self, address):
+        try:
+            page = self.pages.get(address >> Memory.PAGE_BITS)
+        except TypeError:
+            return [self[a] for a in range(address.start or 0, address.stop, address.step or 1)]
+
+        if page is not None:
+            return page[address & Memory.PAGE_MASK]
+        if address < 0:
+            raise Exception("read from negative address", address)
+        return 0
+
+    def __setitem__(self, address, value):
+        page_idx = address >> Memory.PAGE_BITS
+        page = self.pages.get(page_idx)
+        if page is None or page_idx in self.shared:
+            if address < 0:
+                raise Exception("write to negative address", address)
+            page = self.allocate(page_idx)
+        page[address & Memory.PAGE_MASK] = value
+        self.dirty.add(page_idx)
+
+    def new_page(self):
+        return [0] * Memory.PAGE_SIZE
+
+    def allocate(self, page_idx):
+        page = self.pages.get(page_idx)
+        page = page[:] if page is not None else self.new_page()
+        self.pages[page_idx] = page
+        self.shared.discard(page_idx)
+        self.dirty.add(page_idx)
+        self.peak_pages = max(self.peak_pages, len(self.pages))
+        return page
+
+    def resident_pages(self):
+        return len(self.pages)
+
+    def dirty_pages(self):
+        # written since the last mark_clean, forks do not change it
+        return [page_idx for page_idx in self.pages if page_idx in self.dirty]
+
+    def mark_clean(self):
+        self.dirty.clear()
+
+    def fork(self):
+        memory = type(self)()
+        memory.pages = dict(self.pages)
+        memory.shared = set(self.pages)
+        memory.dirty = set()
+        memory.peak_pages = len(self.pages)
+        self.shared = set(self.pages)
+        return memory
+
+
+class ArrayMemory(Memory):
+    # pages are flat int64 arrays, values which do not fit are kept aside in big
+    TYPECODE = 'q'
+    OVERFLOW = -2 ** 63  # marks a cell whose value is in big
+
+    def __init__(self, values=()):
+        super().__init__(values)
+        self.big = {}
+
+        for page_idx, page in list(self.pages.items()):
+            if ArrayMemory.OVERFLOW not in page:
+                try:
+                    self.pages[page_idx] = array(ArrayMemory.TYPECODE, page)
+                    continue
+                except OverflowError:
+                    pass
+
+            self.pages[page_idx] = self.new_page()
+            for offset, value in enumerate(page):
+                self[(page_idx << Memory.PAGE_BITS) + offset] = value
+
+    def new_page(self):
+        return array(ArrayMemory.TYPECODE, bytes(8 * Memory.PAGE_SIZE))
+
+    def __getitem__(self, address):
+        try:
+            page = self.pages.get(address >> Memory.PAGE_BITS)
+        except TypeError:
+            return [self[a] for a in range(address.start or 0, address.stop, address.step or 1)]
+
+        if page is None:
+            if address < 0:
+                raise Exception("read from negative address", address)
+            return 0
+
+        value = page[address & Memory.PAGE_MASK]
+        if value == ArrayMemory.OVERFLOW:
+            return self.big[address]
+        return value
+
+    def __setitem__(self, address, value):
+        page_idx = address >> Memory.PAGE_BITS
+        page = self.pages.get(page_idx)
+        if page is None or page_idx in self.shared:
+            if address < 0:
+                raise Exception("write to negative address", address)
+            page = self.allocate(page_idx)
+
+        self.dirty.add(page_idx)
+        offset = address & Memory.PAGE_MASK
+        if value != ArrayMemory.OVERFLOW:
+            try:
+                page[offset] = value
+                if self.big:
+                    self.big.pop(address, None)
+                return
+            except OverflowError:
+                pass
+
+        page[offset] = ArrayMemory.OVERFLOW
+        self.big[address] = value
+
+    def fork(self):
+        memory = super().fork()
+        memory.big = dict(self.big)
+        return memory
+
+
+class Image:
+    # parsed program, shared read only by every computer which loads it
+    def __init__(self, digest, values, registry=None):
+        self.digest = digest
+        self.values = values
+        self.registry = registry
+        self.memories = {}  # memory class -> memory which is only ever forked
+        self.analyses = {}  # name -> result of some static pass over values, e.g. cfg
+
+    def memory(self, memory_class):
+        base = self.memories.get(memory_class)
+        if base is None:
+            base = memory_class(self.values)
+            self.memories[memory_class] = base
+        return base.fork()
+
+    def analysis(self, name, build):
+        if name not in self.analyses:
+            self.analyses[name] = build(self.values)
+            if self.registry is not None:
+                self.registry.save(self)
+        return self.analyses[name]
+
+
+class ProgramRegistry:
+    # tape text -> Image, optionally persisted under cache_dir by sha256 of the text
+    # bump VERSION whenever Image or anything kept in its analyses changes shape
+    VERSION = 2
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir
+        self.images = {}
+
+    def get(self, tape):
+        image = self.images.get(tape)
+        if image is None:
+            digest = hashlib.sha256(tape.encode()).hexdigest()
+            image = self.read(digest)
+            if image is None:
+                image = Image(digest, [int(x) for x in tape.split(',')], registry=self)
+                self.save(image)
+            self.images[tape] = image
+        return image
+
+    def path(self, digest):
+        return os.path.join(self.cache_dir, f"{digest}.v{ProgramRegistry.VERSION}.pickle")
+
+    def read(self, digest):
+        if self.cache_dir is None or not os.path.exists(self.path(digest)):
+            return None
+
+        with open(self.path(digest), 'rb') as f:
+            stored = pickle.load(f)
+        if stored.get('version') != ProgramRegistry.VERSION:
+            return None
+
+        image = Image(digest, stored['values'], registry=self)
+        image.analyses = stored['analyses']
+        return image
+
+    def save(self, image):
+        if self.cache_dir is None:
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{self.path(image.digest)}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            stored = {'version': ProgramRegistry.VERSION, 'values': image.values, 'analyses': image.analyses}
+            pickle.dump(stored, f, pickle.HIGHEST_PROTOCOL)
+        # other processes see either the old file or the whole new one
+        os.replace(tmp_path, self.path(image.digest))
+
+
+class Snapshot:
+    def __init__(self, computer):
+        self.pointer = computer.pointer
+        self.relative_base = computer.relative_base
+        self.state = computer.state
+        self.tape = computer.tape.fork()
+        self.decoded = dict(computer.decoded)
+        self.decoded_addresses = set(computer.decoded_addresses)
+        self.inq = computer.inq.copy() if computer.inq else None
+        self.outq = computer.outq.copy() if computer.outq else None
 
 
 class Queue:
@@ -215,6 +547,15 @@ class Queue:
     def is_empty(self):
         return False if self.q else True
 
+    def copy(self):
+        queue = Queue(name=self.name)
+        queue.q = self.q.copy()
+        return queue
+
+    def assign(self, other):
+        # takes over a copy of what other holds, the queue object stays the one everybody refers to
+        self.q = other.q.copy()
+
     def __str__(self):
         return str(self.name) + " " + str(list(self.q))
 
@@ -222,21 +563,187 @@ class Queue:
         return str(self)
 
 
+class AsciiQueue(Queue):
+    COMPACT_SIZE = 4096
+    CODEC = 'latin-1'  # character n is value n for every value which fits in a byte, in and out alike
+
+    def __init__(self, name=None):
+        super().__init__(name=name)
+        # bytes wait in buffer, once a value does not fit in a byte everything queued goes to self.q
+        self.buffer = bytearray()
+        self.start = 0
+
+    def to_fallback(self):
+        self.q.extend(self.buffer[self.start:])
+        self.buffer = bytearray()
+        self.start = 0
+
+    def get_message(self):
+        if self.q:
+            return self.q.popleft()
+
+        if self.start >= len(self.buffer):
+            raise IndexError("get_message from empty queue")
+
+        message = self.buffer[self.start]
+        self.start += 1
+        if self.start >= AsciiQueue.COMPACT_SIZE and self.start * 2 >= len(self.buffer):
+            del self.buffer[:self.start]
+            self.start = 0
+        return message
+
+    def put_message(self, message):
+        if not self.q and 0 <= message < 256:
+            self.buffer.append(message)
+            return
+
+        if not self.q:
+            self.to_fallback()
+        self.q.append(message)
+
+    def put_text(self, text):
+        data = text.encode(AsciiQueue.CODEC)
+        if self.q:
+            self.q.extend(data)
+        else:
+            self.buffer += data
+
+    def put_line(self, line):
+        self.put_text(line + "\n")
+
+    def get_text(self):
+        # everything up to the first value which is not a character
+        if not self.q:
+            text = self.buffer[self.start:].decode(AsciiQueue.CODEC)
+            self.buffer = bytearray()
+            self.start = 0
+            return text
+
+        chars = []
+        while self.q and 0 <= self.q[0] < 256:
+            chars.append(chr(self.q.popleft()))
+        return ''.join(chars)
+
+    def is_empty(self):
+        return not self.q and self.start >= len(self.buffer)
+
+    def copy(self):
+        queue = AsciiQueue(name=self.name)
+        queue.buffer = self.buffer[self.start:]
+        queue.q = self.q.copy()
+        return queue
+
+    def assign(self, other):
+        super().assign(other)
+        self.buffer = other.buffer[other.start:] if isinstance(other, AsciiQueue) else bytearray()
+        self.start = 0
+
+    def __str__(self):
+        return str(self.name) + " " + str(list(self.buffer[self.start:]) + list(self.q))
+
+
 class Computer:
     PAUSED = "PAUSED"
     RUNNING = "RUNNING"
     HALTED = "HALTED"
 
-    def __init__(self, inq=None, outq=None):
-        self.inq = inq
-        self.outq = outq
+    # reasons why run returned, besides HALTED
+    NEED_INPUT = "NEED_INPUT"
+    BUDGET = "BUDGET"
+    OUTPUT = "OUTPUT"
+
+    MAX_NUM_OF_ARGS = 3
+
+    operation_provider = OperationProvider
+    memory_class = Memory  # tape backend, ArrayMemory keeps cells in int64 arrays
+    registry = ProgramRegistry()  # give it a cache_dir to keep parsed programs between runs
+
+    def __init__(self, inq=None, outq=None, input_provider=None, profiler=None):
+        self.inq = inq if inq is not None else Queue(name="in")
+        self.outq = outq if outq is not None else Queue(name="out")
+        self.input_provider = input_provider  # called for the next input when inq is empty
+        self.profiler = profiler
         self.state = Computer.PAUSED
         self.pointer = 0
         self.relative_base = 0
+        self.decoded = {}
+        self.decoded_addresses = set()
+        self.steps = 0
+        self.stop_reason = None
+        self.outputs_left = -1
+        self.journal = None
+        self.checkpoint_state = None
+
+    def snapshot(self):
+        return Snapshot(self)
+
+    def restore(self, snapshot, queues=True):
+        self.pointer = snapshot.pointer
+        self.relative_base = snapshot.relative_base
+        self.state = snapshot.state
+        self.tape = snapshot.tape.fork()
+        self.decoded = dict(snapshot.decoded)
+        self.decoded_addresses = set(snapshot.decoded_addresses)
+
+        if queues and snapshot.inq:
+            self.inq.assign(snapshot.inq)
+        if queues and snapshot.outq:
+            self.outq.assign(snapshot.outq)
+
+    def fork(self):
+        snapshot = self.snapshot()
+        computer = type(self)(inq=snapshot.inq, outq=snapshot.outq, input_provider=self.input_provider, profiler=self.profiler)
+        computer.memory_class = self.memory_class
+        computer.restore(snapshot, queues=False)
+        return computer
 
     def load(self, tape):
-        self.tape = [int(x) for x in tape.split(',')]
-        self.tape += [0] * int(1e6)
+        self.tape = self.registry.get(tape).memory(self.memory_class)
+        self.decoded = {}
+        self.decoded_addresses = set()
+
+    def checkpoint(self):
+        # from now on every write remembers the old value, rollback undoes them in reverse
+        self.journal = []
+        self.checkpoint_state = (self.pointer, self.relative_base, self.state, self.stop_reason)
+
+    def rollback(self):
+        if self.journal is None:
+            raise Exception("rollback without checkpoint")
+
+        journal = self.journal
+        self.journal = None
+        for address, value in reversed(journal):
+            self.store(address, value)
+
+        self.pointer, self.relative_base, self.state, self.stop_reason = self.checkpoint_state
+        self.checkpoint_state = None
+
+    def commit(self):
+        self.journal = None
+        self.checkpoint_state = None
+
+    def store(self, address, value):
+        if self.journal is not None:
+            self.journal.append((address, self.tape[address]))
+        self.tape[address] = value
+        if address in self.decoded_addresses:
+            self.invalidate(address)
+
+    def invalidate(self, address):
+        # program overwrote its own code, drop every decoded instruction covering address
+        for pointer in range(address - Computer.MAX_NUM_OF_ARGS, address + 1):
+            operation = self.decoded.get(pointer)
+            if operation is not None and pointer + operation.num_of_args >= address:
+                del self.decoded[pointer]
+
+    def get_operation(self):
+        operation = self.decoded.get(self.pointer)
+        if operation is None:
+            operation = self.operation_provider.get_handler(self.pointer, self.tape)
+            self.decoded[self.pointer] = operation
+            self.decoded_addresses.update(range(self.pointer, self.pointer + operation.num_of_args + 1))
+        return operation
 
     def read(self):
         if self.inq.is_empty():
@@ -245,32 +752,75 @@ class Computer:
 
     def write(self, out):
         self.outq.put_message(out)
+        self.outputs_left -= 1
+        if self.outputs_left == 0:
+            self.pause(Computer.OUTPUT)
 
     def is_halted(self):
         return self.state == Computer.HALTED
 
     def halt(self):
         self.state = Computer.HALTED
+        self.stop_reason = Computer.HALTED
 
-    def pause(self):
+    def pause(self, reason=NEED_INPUT):
         self.state = Computer.PAUSED
+        self.stop_reason = reason
 
     def can_read(self):
+        if self.inq.is_empty() and self.input_provider is not None:
+            value = self.input_provider()
+            if value is not None:
+                self.inq.put_message(value)
+
         res = not self.inq.is_empty()
         return res
 
     def add_to_relative_base(self, v):
         self.relative_base += v
 
-    def run(self, v=False):
+    def run(self, v=False, max_steps=None, max_outputs=None):
         self.state = Computer.RUNNING
+        self.outputs_left = max_outputs or -1
+
+        if self.profiler is not None:
+            steps = self.profiler.execute(self, max_steps)
+        else:
+            steps = self.execute(max_steps, v=v)
+
+        # input which paused the computer was not executed
+        self.steps += steps - (self.stop_reason == Computer.NEED_INPUT)
+        self.outputs_left = -1
+
+        return self.stop_reason
+
+    def execute(self, max_steps=None, v=False):
+        steps = 0
 
         while self.state == Computer.RUNNING:
+            if steps == max_steps:
+                self.pause(Computer.BUDGET)
+                break
             if v:
                 print("pointer:", self.pointer)
                 print(self.tape[:50])
-            operation = OperationProvider.get_next(self.pointer, self.tape)
+            operation = self.get_operation()
             operation.execute(self)
+            steps += 1
+
+        return steps
+
+    def run_until_output(self, k=1, max_steps=None):
+        return self.run(max_steps=max_steps, max_outputs=k)
+
+    def outputs(self):
+        while True:
+            reason = self.run_until_output()
+            while not self.outq.is_empty():
+                yield self.outq.get_message()
+
+            if reason != Computer.OUTPUT:
+                return
 
     @staticmethod
     def all_halted(computers):
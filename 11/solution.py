@@ -45,17 +45,12 @@ class PaintingRobot:
 
     def paint(self):
         pixels = dd(lambda: PaintingRobot.BLACK)
-        inq = self.computer.inq
-        outq = self.computer.outq
 
-        while not self.computer.is_halted():
-            current_color = pixels[self.position]
-            inq.put_message(current_color)
-            self.computer.run()
-
-            color = outq.get_message()
-            turn = outq.get_message()
+        # computer asks for the color under the robot whenever it needs it
+        self.computer.input_provider = lambda: pixels[self.position]
+        outputs = self.computer.outputs()
 
+        for color, turn in zip(outputs, outputs):
             pixels[self.position] = color
             self.turn(turn)
             self.go_forward()
@@ -1,6 +1,7 @@
 from int_computer import Computer, Queue
 from point import Point
-from collections import defaultdict as dd
+from grid import Grid
+from render import render
 
 
 class PaintingRobot:
@@ -13,6 +14,8 @@ class PaintingRobot:
     BLACK = 0
     WHITE = 1
 
+    PALETTE = {BLACK: ' ', WHITE: '@'}
+
     TURN_LEFT = 0
     TURN_RIGHT = 1
 
@@ -44,20 +47,14 @@ class PaintingRobot:
         self.position = Point(self.position.x + dx, self.position.y + dy)
 
     def get_pixels(self):
-        pixels = dd(lambda: PaintingRobot.BLACK)
+        pixels = Grid(PaintingRobot.BLACK)
         pixels[Point(0, 0)] = PaintingRobot.WHITE
 
-        inq = self.computer.inq
-        outq = self.computer.outq
-
-        while not self.computer.is_halted():
-            current_color = pixels[self.position]
-            inq.put_message(current_color)
-            self.computer.run()
-
-            color = outq.get_message()
-            turn = outq.get_message()
+        # computer asks for the color under the robot whenever it needs it
+        self.computer.input_provider = lambda: pixels[self.position]
+        outputs = self.computer.outputs()
 
+        for color, turn in zip(outputs, outputs):
             pixels[self.position] = color
             self.turn(turn)
             self.go_forward()
@@ -66,35 +63,7 @@ class PaintingRobot:
 
     @staticmethod
     def paint_pixels(pixels):
-        min_x = min(pixels, key=lambda x: x.x).x
-        min_y = min(pixels, key=lambda x: x.y).y
-
-        min_p = Point(min_x, min_y)
-
-        def sub_mins(t):
-            return (t[0] - min_p, t[1])
-
-        shifted_pixels = dd(int, dict(map(
-            sub_mins,
-            pixels.items()
-        )))
-
-        max_x = max(shifted_pixels, key=lambda x: x.x).x
-        max_y = max(shifted_pixels, key=lambda x: x.y).y
-
-        rows = []
-
-        for y in range(max_y + 1):
-            row = []
-            for x in range(max_x + 1):
-                row.append(str(shifted_pixels[Point(x, y)]))
-            rows = [row] + rows
-
-        image = "\n".join(map(lambda x: "".join(x), rows))
-
-        nice_to_read = image.replace("0", " ").replace("1", "@")
-
-        return nice_to_read
+        return render(pixels.array(), PaintingRobot.PALETTE, flip=True)
 
 
 def solve(tape):
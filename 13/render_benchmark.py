@@ -0,0 +1,81 @@
+from point2 import Point
+from render import render, expand
+from solution2 import Arcade, tape
+from collections import defaultdict as dd
+
+import time
+
+
+def legacy_display(points):
+    # per cell lookup and replace chain, as Arcade.display was before the renderer
+    to_draw = dd(lambda: Arcade.EMPTY)
+    for p, obj in points.items():
+        to_draw[p] = obj
+
+    max_x = max(to_draw, key=lambda x: x.x).x
+    max_y = max(to_draw, key=lambda x: x.y).y
+
+    rows = []
+    for y in range(max_y + 1):
+        row = []
+        for x in range(max_x + 1):
+            row.append(str(to_draw[Point(x, y)]))
+        rows.append(row)
+
+    image = "\n".join(map(lambda x: "".join(x), rows))
+    return image.replace("0", " ").replace("1", "W").replace("2", "b").replace("3", "-").replace("4", "@")
+
+
+class RenderingArcade(Arcade):
+    # draws a frame every time the ball moves
+
+    def __init__(self, tape, legacy):
+        super().__init__(tape)
+        self.legacy = legacy
+        self.points = {}
+        self.frames = 0
+        self.render_time = 0
+        self.frame_chars = 0
+        self.frame_runs = 0
+
+    def update_state(self, x, y, obj):
+        super().update_state(x, y, obj)
+        if x == -1 and y == 0:
+            return
+        self.points[Point(x, y)] = obj
+        if obj != Arcade.BALL:
+            return
+
+        start = time.perf_counter()
+        if self.legacy:
+            frame = legacy_display(self.points)
+        else:
+            frame = render(self.screen.array(), Arcade.PALETTE)
+        self.render_time += time.perf_counter() - start
+        self.frames += 1
+
+        if not self.legacy and self.frames == 1:
+            runs = render(self.screen.array(), Arcade.PALETTE, rle=True)
+            assert expand(runs) == frame
+            self.frame_chars = len(frame)
+            self.frame_runs = len(runs)
+
+
+def benchmark():
+    for legacy in [True, False]:
+        arcade = RenderingArcade(tape, legacy)
+        start = time.perf_counter()
+        arcade.play()
+        total = time.perf_counter() - start
+
+        name = "per cell" if legacy else "renderer"
+        game = total - arcade.render_time
+        print(
+            f"{name}: {arcade.frames} frames, {1000 * arcade.render_time / arcade.frames:.3f} ms/frame,"
+            f" rendering {arcade.render_time:.2f}s, game {game:.2f}s"
+        )
+
+    print(f"first frame: {arcade.frame_chars} characters, {arcade.frame_runs} runs")
+
+
+benchmark()
@@ -1,6 +1,7 @@
-from int_computer import Computer, Queue
+from int_computer import Computer
 from point2 import Point
-from collections import defaultdict as dd
+from grid import Grid
+from render import render
 
 def sign(x):
     if x == 0:
@@ -15,72 +16,43 @@ class Arcade:
     HORIZONTAL_PADDLE = 3
     BALL = 4
 
+    PALETTE = {EMPTY: ' ', WALL: 'W', BLOCK: 'b', HORIZONTAL_PADDLE: '-', BALL: '@'}
+
     LEFT = -1
     NONE = 0
     RIGHT = 1
 
     def __init__(self, tape):
-        self.in_queue = Queue(name="in")
-        self.out_queue = Queue(name="out")
-
-        self.computer = Computer(inq=self.in_queue, outq=self.out_queue)
+        self.computer = Computer(input_provider=self.joystick)
         self.computer.load(tape)
-        self.computer.run()
 
-        self.points = {}
-        self.update_state()
+        self.screen = Grid(Arcade.EMPTY)
         self.score = 0
 
-    def move(self, direction):
-        self.in_queue.put_message(direction)
-
-    def blocks_present(self):
-        return any([True for p in self.points if self.points[p] == Arcade.BLOCK])
+    def joystick(self):
+        return sign(self.ball.x - self.paddle.x)
 
-    def update_state(self):
-        while not self.out_queue.is_empty():
-            x = self.out_queue.get_message()
-            y = self.out_queue.get_message()
-            obj = self.out_queue.get_message()
-
-            if x == -1 and y == 0:
-                self.score = obj
-                continue
-            
-            point = Point(x, y)
-            self.points[point] = obj
-            if obj == Arcade.BALL:
-                self.ball = point
-            if obj == Arcade.HORIZONTAL_PADDLE:
-                self.paddle = point
+    def update_state(self, x, y, obj):
+        if x == -1 and y == 0:
+            self.score = obj
+            return
 
+        self.screen.set(x, y, obj)
+        point = Point(x, y)
+        if obj == Arcade.BALL:
+            self.ball = point
+        if obj == Arcade.HORIZONTAL_PADDLE:
+            self.paddle = point
 
     def play(self):
-        while not self.computer.is_halted() and self.blocks_present():
-            move_to_perform = sign(self.ball.x - self.paddle.x)
-            self.move(move_to_perform)
-            self.computer.run()
-            self.update_state()
+        # screen updates are handled as soon as the game draws them
+        outputs = self.computer.outputs()
+        for x, y, obj in zip(outputs, outputs, outputs):
+            self.update_state(x, y, obj)
 
     def display(self):
-        to_draw = dd(lambda: Arcade.EMPTY)
-        for p, obj in self.points.items():
-            to_draw[p] = obj
-
-        max_x = max(to_draw, key=lambda x: x.x).x
-        max_y = max(to_draw, key=lambda x: x.y).y
-
-        rows = []
-
-        for y in range(max_y + 1):
-            row = []
-            for x in range(max_x + 1):
-                row.append(str(to_draw[Point(x, y)]))
-            rows.append(row)
-
-        image = "\n".join(map(lambda x: "".join(x), rows))
-
-        game = image.replace("0", " ").replace("1", "W").replace("2", "b").replace("3", "-").replace("4", "@")
+        _, _, max_x, max_y = self.screen.bounds
+        game = render(self.screen.region(0, 0, max_x + 1, max_y + 1), Arcade.PALETTE)
 
         positions = f"paddle: {self.paddle}, ball: {self.ball}, score: {self.score}"
 
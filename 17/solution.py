@@ -1,4 +1,4 @@
-from int_computer import Computer, Queue
+from int_computer import Computer, Queue, AsciiQueue
 from collections import defaultdict as dd
 from point import Point
 
@@ -10,28 +10,18 @@ NL = "\n"
 
 def get_points(tape):
     in_queue = Queue(name="in")
-    out_queue = Queue(name="out")
+    out_queue = AsciiQueue(name="out")
     computer = Computer(inq=in_queue, outq=out_queue)
     computer.load(tape)
 
     computer.run()
 
     points = dd(lambda: EMPTY)
-    y = 0
-    x = 0
 
-    while not out_queue.is_empty():
-        current = chr(out_queue.get_message())
-        # print(current, end='')
-
-        if current == "\n":
-            y += 1
-            x = 0
-            continue
-
-        if not current == EMPTY:
-            points[Point(x, y)] = current
-        x += 1
+    for y, line in enumerate(out_queue.get_text().split(NL)):
+        for x, current in enumerate(line):
+            if not current == EMPTY:
+                points[Point(x, y)] = current
 
     return points
 
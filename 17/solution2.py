@@ -1,24 +1,20 @@
-from int_computer import Computer, Queue
+from int_computer import Computer, AsciiQueue
 
 
 def add_line(queue, line):
-    for c in line:
-        queue.put_message(ord(c))
-    queue.put_message(ord("\n"))
+    queue.put_line(line)
 
 
 def print_output(queue):
     while not queue.is_empty():
-        curr = queue.get_message()
-        if curr < 255:
-            print(chr(curr), end='')
-        else:
-            print(curr)
+        print(queue.get_text(), end='')
+        if not queue.is_empty():
+            print(queue.get_message())
 
 
 def solve(tape):
-    in_queue = Queue(name="in")
-    out_queue = Queue(name="out")
+    in_queue = AsciiQueue(name="in")
+    out_queue = AsciiQueue(name="out")
     computer = Computer(inq=in_queue, outq=out_queue)
     computer.load(tape)
 
@@ -0,0 +1,59 @@
+from point import Point
+from collections import defaultdict as dd
+
+import time
+
+
+class PlainPoint:
+    # point as every day had it before, for comparison
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __eq__(self, p):
+        if not isinstance(p, PlainPoint):
+            return False
+        return self.x == p.x and self.y == p.y
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
+
+SIZE = 200
+ROUNDS = 5
+
+
+def lookups_per_second(point_class, fresh):
+    board = dd(int)
+    for y in range(SIZE):
+        for x in range(SIZE):
+            board[point_class(x, y)] = x ^ y
+
+    keys = [point_class(x, y) for y in range(SIZE) for x in range(SIZE)]
+
+    start = time.perf_counter()
+    total = 0
+    for _ in range(ROUNDS):
+        if fresh:
+            # the usual board[Point(x, y)] pattern, a new point for every lookup
+            for y in range(SIZE):
+                for x in range(SIZE):
+                    total += board[point_class(x, y)]
+        else:
+            for p in keys:
+                total += board[p]
+    elapsed = time.perf_counter() - start
+
+    return int(ROUNDS * SIZE * SIZE / elapsed)
+
+
+def benchmark():
+    for fresh in [False, True]:
+        name = "new point per lookup" if fresh else "existing points"
+        before = lookups_per_second(PlainPoint, fresh)
+        after = lookups_per_second(Point, fresh)
+        print(f"{name:>21}: {before:>9} lookups/s before, {after:>9} after, {after / before:.2f}x")
+
+
+benchmark()
@@ -0,0 +1,211 @@
+from array import array
+
+import heapq
+import itertools
+
+import numpy as np
+
+
+UNREACHED = -1
+FLIP = bytes.maketrans(b'\x00\x01', b'\x01\x00')
+
+
+class Board:
+    # 2D array of cell codes flattened row by row with a border of blocked cells around it,
+    # so cell +-1 and cell +-width are the neighbours and never wrap around a row
+
+    def __init__(self, cells, passable):
+        cells = np.pad(np.asarray(cells, dtype=np.uint8), 1)
+        mask = np.pad(passable(cells[1:-1, 1:-1]), 1)
+
+        self.height, self.width = cells.shape
+        self.size = cells.size
+        self.cells = cells.ravel()
+        self.passable = bytearray(mask.astype(np.uint8).tobytes())
+
+    @staticmethod
+    def from_rows(rows, passable):
+        width = max(len(row) for row in rows)
+        cells = np.array([[ord(char) for char in row.ljust(width)] for row in rows], dtype=np.uint8)
+        return Board(cells, passable)
+
+    def cell(self, x, y):
+        return (y + 1) * self.width + x + 1
+
+    def xy(self, cell):
+        y, x = divmod(cell, self.width)
+        return x - 1, y - 1
+
+    def find(self, char):
+        return [int(cell) for cell in np.flatnonzero(self.cells == ord(char))]
+
+    def neighbours(self, cell):
+        passable = self.passable
+        return [n for n in (cell - self.width, cell + self.width, cell - 1, cell + 1) if passable[n]]
+
+    def grid(self, values):
+        # distances or any other per cell array back in the shape of the board, without the border
+        return np.asarray(values[:self.size]).reshape(self.height, self.width)[1:-1, 1:-1]
+
+
+class SearchResult:
+
+    def __init__(self, distances, parents=None, found=None):
+        self.distances = distances
+        self.parents = parents
+        self.found = found
+
+    def distance(self, state):
+        if isinstance(self.distances, dict):
+            return self.distances.get(state)
+        if state >= len(self.distances) or self.distances[state] == UNREACHED:
+            return None
+        return int(self.distances[state])
+
+    def path(self, state):
+        # states from a source to state, needs the search to have kept parents
+        if self.distance(state) is None:
+            return None
+
+        steps = []
+        while state is not None:
+            steps.append(state)
+            state = self.parents[state]
+            if isinstance(state, np.integer):
+                state = int(state)
+            if state == UNREACHED:
+                state = None
+
+        return steps[::-1]
+
+
+def as_result(distances, parents, found):
+    # array('i') storage viewed as numpy without a copy
+    distances = np.frombuffer(distances, dtype=np.int32)
+    if parents is not None:
+        parents = np.frombuffer(parents, dtype=np.int32)
+    return SearchResult(distances, parents, found)
+
+
+def bfs(sources, neighbours, size, targets=(), parents=False):
+    # level by level from all sources at once over int states, storage grows when a state is not below size
+    distances = array('i', [UNREACHED]) * size
+    previous = array('i', [UNREACHED]) * size if parents else None
+    visited = bytearray(size)
+    targets = set(targets)
+
+    frontier = []
+    for source in sources:
+        if not visited[source]:
+            visited[source] = 1
+            distances[source] = 0
+            frontier.append(source)
+            if source in targets:
+                return as_result(distances, previous, source)
+
+    dist = 0
+    while frontier:
+        dist += 1
+        next_frontier = []
+
+        for state in frontier:
+            for n in neighbours(state):
+                if n >= len(visited):
+                    grow = (n // size + 1) * size - len(visited)
+                    visited += bytearray(grow)
+                    distances += array('i', [UNREACHED]) * grow
+                    if parents:
+                        previous += array('i', [UNREACHED]) * grow
+                elif visited[n]:
+                    continue
+
+                visited[n] = 1
+                distances[n] = dist
+                if parents:
+                    previous[n] = state
+                if n in targets:
+                    return as_result(distances, previous, n)
+                next_frontier.append(n)
+
+        frontier = next_frontier
+
+    return as_result(distances, previous, None)
+
+
+def grid_bfs(board, sources, targets=(), stops=None, parents=False):
+    # bfs specialised for a Board, blocked cells start out as visited so one lookup decides a neighbour
+    # cells in stops get a distance but are not expanded, unless they are sources
+    width = board.width
+    distances = array('i', [UNREACHED]) * board.size
+    previous = array('i', [UNREACHED]) * board.size if parents else None
+    visited = board.passable.translate(FLIP)
+    targets = set(targets)
+
+    frontier = []
+    for source in sources:
+        visited[source] = 1
+        distances[source] = 0
+        frontier.append(source)
+        if source in targets:
+            return as_result(distances, previous, source)
+
+    dist = 0
+    while frontier:
+        dist += 1
+        next_frontier = []
+
+        for cell in frontier:
+            if stops is not None and stops[cell] and distances[cell]:
+                continue
+
+            for n in (cell - width, cell + width, cell - 1, cell + 1):
+                if visited[n]:
+                    continue
+
+                visited[n] = 1
+                distances[n] = dist
+                if parents:
+                    previous[n] = cell
+                if n in targets:
+                    return as_result(distances, previous, n)
+                next_frontier.append(n)
+
+        frontier = next_frontier
+
+    return as_result(distances, previous, None)
+
+
+def dijkstra(sources, neighbours, is_target=None, heuristic=None):
+    # neighbours(state) gives (state, cost) pairs, states only have to be hashable
+    # with a heuristic it is A*, which is exact as long as the heuristic never overestimates
+    distances = {}
+    parents = {}
+    counter = itertools.count()  # ties never compare the states themselves
+    heap = []
+
+    for source in sources:
+        distances[source] = 0
+        parents[source] = None
+        heapq.heappush(heap, (heuristic(source) if heuristic else 0, next(counter), 0, source))
+
+    done = set()
+    while heap:
+        _, _, dist, state = heapq.heappop(heap)
+        if state in done:
+            continue
+        done.add(state)
+
+        if is_target is not None and is_target(state):
+            return SearchResult(distances, parents, state)
+
+        for n, cost in neighbours(state):
+            new_dist = dist + cost
+            if n in done or new_dist >= distances.get(n, new_dist + 1):
+                continue
+
+            distances[n] = new_dist
+            parents[n] = state
+            priority = new_dist + heuristic(n) if heuristic else new_dist
+            heapq.heappush(heap, (priority, next(counter), new_dist, n))
+
+    return SearchResult(distances, parents, None)
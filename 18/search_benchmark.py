@@ -0,0 +1,87 @@
+from point import Point
+from search import Board, grid_bfs, dijkstra
+from collections import deque
+
+import re
+import time
+
+
+def read_maze():
+    found = re.search(r"^maze = '''(.*?)'''", open('solution.py').read(), re.M | re.S)
+    return found.group(1).strip().split()
+
+
+def legacy_distances(rows, start):
+    # hand rolled bfs as the days had it, LVL_UP marker and a set of visited points
+    def get_neighbours(p):
+        potential = [Point(p.x, p.y + 1), Point(p.x, p.y - 1), Point(p.x - 1, p.y), Point(p.x + 1, p.y)]
+        return [n for n in potential if rows[n.y][n.x] != '#']
+
+    distances = {}
+    visited = set()
+    to_visit = deque([start, 'LVL_UP'])
+    dist = 0
+
+    while len(to_visit) > 1:
+        current = to_visit.popleft()
+        if current == 'LVL_UP':
+            dist += 1
+            to_visit.append('LVL_UP')
+            continue
+        if current in visited:
+            continue
+
+        visited.add(current)
+        distances[current] = dist
+        to_visit += deque([n for n in get_neighbours(current) if n not in visited])
+
+    return distances
+
+
+def timed(f, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = f()
+    return result, (time.perf_counter() - start) / rounds
+
+
+def benchmark():
+    rows = read_maze()
+    board = Board.from_rows(rows, lambda cells: cells != ord('#'))
+    start = board.find('@')[0]
+    x, y = board.xy(start)
+
+    old, old_time = timed(lambda: legacy_distances(rows, Point(x, y)), 3)
+    new, new_time = timed(lambda: grid_bfs(board, [start]), 20)
+    assert all(new.distance(board.cell(p.x, p.y)) == dist for p, dist in old.items())
+    print(f"distances from @ to {len(old)} cells: {1000 * old_time:.1f} ms before, {1000 * new_time:.2f} ms after")
+
+    keys = [cell for cell in range(board.size) if chr(board.cells[cell]).islower()]
+    stops = bytearray(board.size)
+    for cell in keys:
+        stops[cell] = 1
+
+    _, key_time = timed(lambda: [grid_bfs(board, [cell], stops=stops) for cell in keys], 3)
+    print(f"bfs from each of {len(keys)} keys, stopping at keys: {1000 * key_time:.1f} ms")
+
+    # single pair, plain dijkstra against A* with the manhattan distance
+    target = max(keys, key=lambda cell: new.distance(cell))
+    target_x, target_y = board.xy(target)
+
+    def neighbours(cell):
+        return [(n, 1) for n in board.neighbours(cell)]
+
+    def manhattan(cell):
+        cell_x, cell_y = board.xy(cell)
+        return abs(cell_x - target_x) + abs(cell_y - target_y)
+
+    for name, heuristic in [("dijkstra", None), ("a*", manhattan)]:
+        result, elapsed = timed(lambda: dijkstra([start], neighbours, lambda cell: cell == target, heuristic), 3)
+        assert result.distance(target) == new.distance(target)
+        print(
+            f"{name:>8} @ to {chr(board.cells[target])}: {result.distance(target)} steps,"
+            f" {len(result.distances)} states seen, {1000 * elapsed:.1f} ms"
+        )
+
+
+benchmark()
@@ -1,5 +1,7 @@
-from collections import deque
 from point import Point
+from search import Board, dijkstra
+
+import sys
 
 
 class Maze():
@@ -10,6 +12,7 @@ class Maze():
 
     def __init__(self, inp):
         rows = inp.split()
+        self.rows = rows
         self.board = {}
         self.num_of_keys = 0
 
@@ -28,19 +31,6 @@ class Maze():
 
                 self.board[point] = value
 
-    def get_neighbours(self, p):
-        potential = [
-            Point(p.x, p.y + 1),
-            Point(p.x, p.y - 1),
-            Point(p.x - 1, p.y),
-            Point(p.x + 1, p.y)
-        ]
-
-        return list(filter(lambda x: self.board[x] != Maze.WALL, potential))
-
-    def get_value(self, p):
-        return self.board[p]
-
 
 def simplify(maze):
     deltas = [(0, 1), (0, -1), (1, 0), (-1, 0)]
@@ -75,53 +65,145 @@ def analize(inp):
         print(''.join(row))
 
 
-def add_if_key(keys_set, key):
-    if key.islower():
-        return keys_set | frozenset([key])
-
-    return keys_set
-
+class KeyGraph:
+    # walks from the start and from every key to every other key, with the doors they cross
+    # and the keys they pick up on the way as bitmasks
+    # a pair keeps a longer walk too when it crosses fewer doors, in a maze with loops it can go around one
+    START = 26
+    POSITION_BITS = 5
+
+    def __init__(self, maze):
+        board = Board.from_rows(maze.rows, lambda cells: cells != ord(Maze.WALL))
+        cells = {KeyGraph.START: board.cell(maze.player.x, maze.player.y)}
+        for key in range(26):
+            found = board.find(chr(ord('a') + key))
+            if found:
+                cells[key] = found[0]
+
+        self.doors = {}
+        for door in range(26):
+            for cell in board.find(chr(ord('A') + door)):
+                self.doors[cell] = 1 << door
+        self.keys = {cell: key for key, cell in cells.items() if key != KeyGraph.START}
+
+        self.all_keys = sum(1 << key for key in self.keys.values())
+        self.edges = {position: self.walks(board, cell) for position, cell in cells.items()}
+
+    def walks(self, board, source):
+        # bfs over (cell, doors crossed), a state is dropped when its cell was reached with a subset of its doors
+        seen = {source: [0]}
+        frontier = [(source, 0, 0)]
+        edges = []
+        dist = 0
+
+        while frontier:
+            dist += 1
+            next_frontier = []
+
+            for cell, doors, keys in frontier:
+                for n in board.neighbours(cell):
+                    n_doors = doors | self.doors.get(n, 0)
+                    masks = seen.setdefault(n, [])
+                    if any(mask & ~n_doors == 0 for mask in masks):
+                        continue
+                    masks.append(n_doors)
+
+                    n_keys = keys
+                    if n in self.keys and n != source:
+                        key = self.keys[n]
+                        n_keys |= 1 << key
+                        edges.append((key, dist, n_doors, n_keys))
+                    next_frontier.append((n, n_doors, n_keys))
+
+            frontier = next_frontier
+
+        return edges
+
+    def neighbours(self, state):
+        # state is keys mask above the position bits
+        position = state & ((1 << KeyGraph.POSITION_BITS) - 1)
+        mask = state >> KeyGraph.POSITION_BITS
+
+        moves = []
+        for key, dist, doors, keys in self.edges[position]:
+            if mask >> key & 1 or doors & ~mask:
+                continue
+            moves.append((((mask | keys) << KeyGraph.POSITION_BITS) | key, dist))
 
-def legal_door(keys_set, value):
-    if not value.isupper():
-        return True
+        return moves
 
-    return value.lower() in keys_set
+    def is_done(self, state):
+        return state >> KeyGraph.POSITION_BITS == self.all_keys
 
 
 def solve(inp):
     maze = Maze(inp)
-
-    visited = set()
-    to_visit = deque([(maze.player, frozenset()), 'LVL_UP'])
-    dist = 0
-
-    while len(to_visit) > 1:
-        current = to_visit.popleft()
-
-        if current == 'LVL_UP':
-            dist += 1
-            to_visit.append('LVL_UP')
-            continue
-
-        if current in visited:
-            continue
-
-        visited.add(current)
-
-        (point, keys_set) = current
-        value = maze.get_value(point)
-
-        if len(keys_set) == maze.num_of_keys:
-            return dist
-
-        neighbours = maze.get_neighbours(point)
-        with_keys = [(n, add_if_key(keys_set, maze.get_value(n))) for n in neighbours]
-        only_open_dors = [tup for tup in with_keys if legal_door(tup[1], value)]
-
-        to_visit += deque([tup for tup in only_open_dors if tup not in visited])
-
-    raise Exception('not found')
+    graph = KeyGraph(maze)
+
+    result = dijkstra([KeyGraph.START], graph.neighbours, graph.is_done)
+    if result.found is None:
+        raise Exception('not found')
+
+    return result.distance(result.found)
+
+
+examples = [
+    ('''
+#########
+#b.A.@.a#
+#########
+''', 8),
+    ('''
+########################
+#f.D.E.e.C.b.A.@.a.B.c.#
+######################.#
+#d.....................#
+########################
+''', 86),
+    ('''
+########################
+#...............b.C.D.f#
+#.######################
+#.....@.a.B.c.d.A.e.F.g#
+########################
+''', 132),
+    ('''
+#################
+#i.G..c...e..H.p#
+########.########
+#j.A..b...f..D.o#
+########@########
+#k.E..a...g..B.n#
+########.########
+#l.F..d...h..C.m#
+#################
+''', 136),
+    ('''
+########################
+#@..............ac.GI.b#
+###d#e#f################
+###A#B#C################
+###g#h#i################
+########################
+''', 81),
+    # shortest walk to a goes through B, the way around the loop does not
+    ('''
+##########
+#@.B.a...#
+#.######.#
+#........#
+#######A##
+#######b##
+##########
+''', 22),
+]
+
+
+def check_examples():
+    for example, expected in examples:
+        if solve(example) != expected:
+            raise Exception("wrong answer for example", example, expected)
+    print(f"{len(examples)} examples ok")
 
 
 maze = '''
@@ -208,6 +290,10 @@ maze = '''
 #################################################################################
 '''.strip()
 
+# python solution.py --examples checks the puzzle examples before the input
+if __name__ == '__main__' and '--examples' in sys.argv:
+    check_examples()
+
 res = solve(maze)
 
 print(res)
@@ -1,5 +1,5 @@
-from collections import deque
 from point import Point
+from search import Board, UNREACHED, bfs, dijkstra, grid_bfs
 from collections import defaultdict as dd
 
 
@@ -37,6 +37,12 @@ class Maze():
 
                 self.board[point] = value
 
+        # keys, doors and bots end every path which reaches them
+        self.flat_board = Board.from_rows(rows, lambda cells: cells != ord(Maze.WALL))
+        self.stops = bytearray(self.flat_board.size)
+        for point in self.knd.values():
+            self.stops[self.flat_board.cell(point.x, point.y)] = 1
+
     def get_neighbours(self, p):
         potential = [
             Point(p.x, p.y + 1),
@@ -48,30 +54,16 @@ class Maze():
         return list(filter(lambda x: self.board[x] != Maze.WALL, potential))
 
     def get_propositions(self, p):
-        visited = set([p])
-        to_visit = deque(self.get_neighbours(p) + ['LVL_UP'])
-        dist = 1
+        board = self.flat_board
+        result = grid_bfs(board, [board.cell(p.x, p.y)], stops=self.stops)
 
         res = []
-
-        while len(to_visit) > 1:
-            current = to_visit.popleft()
-            visited.add(current)
-
-            if current == 'LVL_UP':
-                dist += 1
-                to_visit.append('LVL_UP')
-                continue
-
-            value = self.board[current]
-
-            if value in self.knd:
+        for value, point in self.knd.items():
+            dist = result.distance(board.cell(point.x, point.y))
+            if point != p and dist is not None:
                 res.append((value, dist))
-                continue
-
-            to_visit += deque([n for n in self.get_neighbours(current) if n not in visited])
 
-        return list(set(res))
+        return res
 
     def get_value(self, p):
         return self.board[p]
@@ -174,25 +166,19 @@ class Graph:
 
     @staticmethod
     def treefy(edges, root):
-        tree_edges = {}
-        visited = set()
-        used_in_tree = {root}
-        to_visit = deque([root])
-
-        while to_visit:
-            current = to_visit.popleft()
-
-            if current in visited:
-                continue
+        # bfs tree, every node hangs under the node it was first reached from
+        names = list(edges)
+        index = {name: idx for idx, name in enumerate(names)}
+        result = bfs([index[root]], lambda idx: [index[n] for n in edges[names[idx]]], len(names), parents=True)
 
-            visited.add(current)
-
-            neighbours = set(edges[current])
-            tree_edges[current] = list(neighbours - used_in_tree)
-
-            used_in_tree = used_in_tree | neighbours
-
-            to_visit += deque([n for n in neighbours if n not in visited])
+        tree_edges = {}
+        for idx, name in enumerate(names):
+            if result.distance(idx) is not None:
+                tree_edges[name] = []
+        for idx, name in enumerate(names):
+            parent = int(result.parents[idx])
+            if result.distance(idx) is not None and parent != UNREACHED:
+                tree_edges[names[parent]].append(name)
 
         return tree_edges
 
@@ -288,35 +274,75 @@ class Graph:
         return aux(set(will_unlock))
 
 
-def add_if_key(keys_set, bots):
-    return keys_set | set(filter(
-        lambda x: x.islower(),
-        bots
-    ))
+class Collector:
+    # search state as an int, the mask of collected keys above one position field per bot
+    # a position is the index of the key or bot start the bot stands on
+    POSITION_BITS = 5
+    POSITION_MASK = (1 << POSITION_BITS) - 1
+
+    def __init__(self, maze, graph):
+        self.graph = graph
+        positions = Maze.BOT_NAMES[:len(maze.bots)] + sorted(item for item in maze.knd if item.islower())
+        self.index = {item: idx for idx, item in enumerate(positions)}
+
+        self.bots = len(maze.bots)
+        self.keys_shift = Collector.POSITION_BITS * self.bots
+        self.all_keys = sum(Collector.bit(item) for item in positions if item.islower())
+        self.start = sum(
+            self.index[bot_name] << (Collector.POSITION_BITS * bot)
+            for bot, bot_name in enumerate(positions[:self.bots])
+        )
 
+        # position -> (position, dist, key it picks up, doors it needs)
+        self.moves = [self.walks(item) for item in positions]
 
-def legal_door(maze, tup):
-    ((bots, keys_set), dist) = tup
+    @staticmethod
+    def bit(item):
+        return 1 << (ord(item.lower()) - ord('a'))
+
+    def walks(self, source):
+        # dijkstra over (item, doors crossed), walks go through doors and bot starts and end at the first key
+        # one to a key is kept unless another is as short with a subset of its doors
+        def neighbours(state):
+            item, doors = state
+            if item != source and item.islower():
+                return []
+            return [
+                ((n, (doors | Collector.bit(n)) if n.isupper() else doors), dist)
+                for n, dist in self.graph.neighbours(item)
+            ]
+
+        result = dijkstra([(source, 0)], neighbours)
+        found = [(dist, item, doors) for (item, doors), dist in result.distances.items() if item != source and item.islower()]
+
+        kept = dd(list)
+        moves = []
+        for dist, item, doors in sorted(found):
+            if any(other & ~doors == 0 for other in kept[item]):
+                continue
+            kept[item].append(doors)
+            moves.append((self.index[item], dist, Collector.bit(item), doors))
 
-    return all(map(
-        lambda x: not x.isupper() or x.lower() in keys_set,
-        bots
-    ))
+        return moves
 
+    def neighbours(self, state):
+        mask = state >> self.keys_shift
+        positions = state & ((1 << self.keys_shift) - 1)
 
-def all_moves(graph, bots):
-    lbots = list(bots)
-    res = []
+        res = []
+        for bot in range(self.bots):
+            shift = bot * Collector.POSITION_BITS
+            others = positions & ~(Collector.POSITION_MASK << shift)
 
-    for idx in range(len(bots)):
-        bot = bots[idx]
-        for neighbour, dist in graph.neighbours(bot):
-            lbots[idx] = neighbour
-            res.append((tuple(lbots), dist))
+            for target, dist, key, doors in self.moves[positions >> shift & Collector.POSITION_MASK]:
+                if doors & ~mask:
+                    continue
+                res.append((((mask | key) << self.keys_shift) | others | (target << shift), dist))
 
-        lbots[idx] = bot
+        return res
 
-    return res
+    def is_done(self, state):
+        return state >> self.keys_shift == self.all_keys
 
 
 def solve(inp):
@@ -324,59 +350,15 @@ def solve(inp):
 
     maze = Maze(inp)
     graph = Graph(maze)
+    collector = Collector(maze, graph)
 
     print('Done!')
 
-    # maze = Maze(inp)
-
-    start = (tuple(Maze.BOT_NAMES), frozenset())
-    to_visit = deque([start, 'LVL_UP'])
-    dist = {start: 0}
-    prev = {start: "END"}
-    path_len = 0
-    local_min = 1e20
-
-    while len(to_visit) > 1:
-        current = to_visit.popleft()
-
-        if current == 'LVL_UP':
-            path_len += 1
-            to_visit.append('LVL_UP')
-            print('Looking at paths of length', path_len)
-            continue
-
-        (bots, keys_set) = current
-
-        if len(keys_set) == maze.num_of_keys:
-            if local_min > dist[current]:
-                local_min = dist[current]
-                print('New min', local_min)
-                print(current)
-                # print(prev[current])
-                back = current
-                prev_back = current
-                short = []
-                while prev[back] != 'END':
-                    prev_back = back
-                    back = prev[back]
-                    short.append(next(iter(set(prev_back[0]) - set(back[0]))))
-                print(short)
-
-        neighbours = all_moves(graph, bots)
-        with_keys = [((n, add_if_key(keys_set, n)), d) for n, d in neighbours]
-        only_open_doors = [tup for tup in with_keys if legal_door(graph, tup)]
-
-        to_add = deque()
-        for (node, one_step_dist) in only_open_doors:
-            dist_up_to_node = dist[current] + one_step_dist
-            if node not in dist or dist[node] > dist_up_to_node:
-                dist[node] = dist_up_to_node
-                prev[node] = current
-                to_add.append(node)
-
-        to_visit += to_add
-
-    raise Exception('not found')
+    result = dijkstra([collector.start], collector.neighbours, collector.is_done)
+    if result.found is None:
+        raise Exception('not found')
+
+    return result.distance(result.found)
 
     # print('Getting blockings...', end='')
 
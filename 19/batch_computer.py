@@ -0,0 +1,141 @@
+from int_computer import Argument, OperationProvider, Add, Mul, In, Out, JumpIfTrue, JumpIfFalse, LessThan, Equals, ChangeRelativeBase, Halt
+
+import numpy as np
+
+
+class BatchComputer:
+    # runs many copies of one program in lockstep, memory is one row per copy
+
+    INT64_SAFE = 2 ** 62
+
+    def __init__(self):
+        self.program = None
+
+    def load(self, tape):
+        self.program = [int(x) for x in tape.split(',')]
+
+    def init_lanes(self, inputs):
+        n = len(inputs)
+        self.inputs = inputs
+        self.mem = np.tile(np.array(self.program, dtype=np.int64), (n, 1))
+        self.pointer = np.zeros(n, dtype=np.int64)
+        self.relative_base = np.zeros(n, dtype=np.int64)
+        self.input_idx = np.zeros(n, dtype=np.int64)
+        self.active = np.ones(n, dtype=bool)
+        self.outputs = [[] for _ in range(n)]
+
+    def ensure_size(self, addresses):
+        if not len(addresses):
+            return
+        if addresses.min() < 0:
+            raise Exception("negative address", addresses.min())
+
+        needed = int(addresses.max()) + 1
+        if needed > self.mem.shape[1]:
+            size = max(needed, 2 * self.mem.shape[1])
+            self.mem = np.pad(self.mem, ((0, 0), (0, size - self.mem.shape[1])))
+
+    def fits(self, estimate):
+        if self.mem.dtype != object and len(estimate) and np.abs(estimate).max() >= BatchComputer.INT64_SAFE:
+            # values too big for int64, from now on lanes keep python ints
+            self.mem = self.mem.astype(object)
+            return False
+        return True
+
+    def get_address(self, lanes, arg_value, mode):
+        if mode == Argument.POSITION:
+            addresses = arg_value
+        elif mode == Argument.RELATIVE:
+            addresses = arg_value + self.relative_base[lanes]
+        else:
+            raise Exception("get_address with mode", mode)
+
+        addresses = addresses.astype(np.int64)
+        self.ensure_size(addresses)
+        return addresses
+
+    def get_value(self, lanes, arg_value, mode):
+        if mode == Argument.IMMEDIATE:
+            return arg_value
+        addresses = self.get_address(lanes, arg_value, mode)
+        return self.mem[lanes, addresses]
+
+    def store(self, lanes, addresses, values):
+        self.mem[lanes, addresses] = values
+
+    def step(self, lanes, pointer, opcode):
+        operation_class, mode_digits = OperationProvider.dispatch_table[opcode]
+        modes = [Argument.modes[digit] for digit in mode_digits]
+        num_of_args = operation_class.num_of_args
+        self.ensure_size(np.array([pointer + num_of_args]))
+
+        args = [self.mem[lanes, pointer + 1 + idx] for idx in range(num_of_args)]
+        next_pointer = pointer + num_of_args + 1
+
+        def value(idx):
+            return self.get_value(lanes, args[idx], modes[idx])
+
+        def address(idx):
+            return self.get_address(lanes, args[idx], modes[idx])
+
+        if operation_class in (Add, Mul):
+            v1, v2 = value(0), value(1)
+            calculate = np.add if operation_class == Add else np.multiply
+            if not self.fits(calculate(v1.astype(float), v2.astype(float))):
+                v1, v2 = v1.astype(object), v2.astype(object)
+            self.store(lanes, address(2), calculate(v1, v2))
+            self.pointer[lanes] = next_pointer
+
+        elif operation_class in (LessThan, Equals):
+            v1, v2 = value(0), value(1)
+            result = v1 < v2 if operation_class == LessThan else v1 == v2
+            self.store(lanes, address(2), result.astype(np.int64))
+            self.pointer[lanes] = next_pointer
+
+        elif operation_class == In:
+            has_input = self.input_idx[lanes] < self.inputs.shape[1]
+            # lanes without more input stop, like a paused Computer
+            self.active[lanes[~has_input]] = False
+            lanes = lanes[has_input]
+            if not len(lanes):
+                return
+            addresses = self.get_address(lanes, args[0][has_input], modes[0])
+            self.store(lanes, addresses, self.inputs[lanes, self.input_idx[lanes]])
+            self.input_idx[lanes] += 1
+            self.pointer[lanes] = next_pointer
+
+        elif operation_class == Out:
+            for lane, v in zip(lanes, value(0)):
+                self.outputs[lane].append(int(v))
+            self.pointer[lanes] = next_pointer
+
+        elif operation_class in (JumpIfTrue, JumpIfFalse):
+            v1, v2 = value(0), value(1)
+            jump = v1 != 0 if operation_class == JumpIfTrue else v1 == 0
+            self.pointer[lanes] = np.where(jump, v2, next_pointer)
+
+        elif operation_class == ChangeRelativeBase:
+            self.relative_base[lanes] += value(0).astype(np.int64)
+            self.pointer[lanes] = next_pointer
+
+        elif operation_class == Halt:
+            self.active[lanes] = False
+
+    def run(self, inputs):
+        self.init_lanes(np.array(inputs, dtype=np.int64).reshape(len(inputs), -1))
+
+        while self.active.any():
+            lanes = np.nonzero(self.active)[0]
+            pointers = self.pointer[lanes]
+
+            # lanes at the same pointer share one vectorized step, diverged ones are masked apart
+            for pointer in np.unique(pointers):
+                group = lanes[pointers == pointer]
+                opcodes = self.mem[group, pointer]
+
+                for opcode in np.unique(opcodes):
+                    if not 0 <= opcode <= OperationProvider.MAX_OPCODE or OperationProvider.dispatch_table[opcode] is None:
+                        raise Exception("unknown opcode:", opcode)
+                    self.step(group[opcodes == opcode], int(pointer), int(opcode))
+
+        return self.outputs
@@ -0,0 +1,145 @@
+from point import Point
+
+import numpy as np
+
+
+class Grid:
+    # dense board of uint8 cells around an origin which moves when the board grows to the left or up
+    # values are ints, or single characters when the default is a character
+    MIN_GROWTH = 16
+
+    def __init__(self, default=0):
+        self.chars = isinstance(default, str)
+        self.default = default
+        self.default_code = self.encode(default)
+
+        self.cells = np.full((0, 0), self.default_code, dtype=np.uint8)
+        self.origin_x = 0
+        self.origin_y = 0
+        self.bounds = None  # min_x, min_y, max_x, max_y of every cell ever set
+
+    def encode(self, value):
+        return ord(value) if self.chars else value
+
+    def decode(self, code):
+        return chr(code) if self.chars else int(code)
+
+    def get(self, x, y):
+        row = y - self.origin_y
+        col = x - self.origin_x
+        height, width = self.cells.shape
+        if 0 <= row < height and 0 <= col < width:
+            return self.decode(self.cells[row, col])
+        return self.default
+
+    def set(self, x, y, value):
+        row = y - self.origin_y
+        col = x - self.origin_x
+        height, width = self.cells.shape
+        if not (0 <= row < height and 0 <= col < width):
+            self.grow(x, y)
+            row = y - self.origin_y
+            col = x - self.origin_x
+
+        self.cells[row, col] = self.encode(value)
+
+        if self.bounds is None:
+            self.bounds = (x, y, x, y)
+        else:
+            min_x, min_y, max_x, max_y = self.bounds
+            self.bounds = (min(min_x, x), min(min_y, y), max(max_x, x), max(max_y, y))
+
+    def grow(self, x, y):
+        height, width = self.cells.shape
+        # every growth at least doubles the side it happens on, so growing is amortized O(1) per cell
+        margin_x = max(width, Grid.MIN_GROWTH)
+        margin_y = max(height, Grid.MIN_GROWTH)
+
+        if width == 0:
+            min_x, max_x = x - margin_x // 2, x + margin_x // 2
+            min_y, max_y = y - margin_y // 2, y + margin_y // 2
+        else:
+            min_x, max_x = self.origin_x, self.origin_x + width - 1
+            min_y, max_y = self.origin_y, self.origin_y + height - 1
+            if x < min_x:
+                min_x = x - margin_x
+            if x > max_x:
+                max_x = x + margin_x
+            if y < min_y:
+                min_y = y - margin_y
+            if y > max_y:
+                max_y = y + margin_y
+
+        cells = np.full((max_y - min_y + 1, max_x - min_x + 1), self.default_code, dtype=np.uint8)
+        row = self.origin_y - min_y
+        col = self.origin_x - min_x
+        cells[row:row + height, col:col + width] = self.cells
+
+        self.cells = cells
+        self.origin_x = min_x
+        self.origin_y = min_y
+
+    def __getitem__(self, p):
+        return self.get(p.x, p.y)
+
+    def __setitem__(self, p, value):
+        self.set(p.x, p.y, value)
+
+    def array(self):
+        # view of the cells inside bounds, row y - min_y and column x - min_x
+        if self.bounds is None:
+            return self.cells[0:0, 0:0]
+
+        min_x, min_y, max_x, max_y = self.bounds
+        return self.cells[
+            min_y - self.origin_y:max_y - self.origin_y + 1,
+            min_x - self.origin_x:max_x - self.origin_x + 1
+        ]
+
+    def region(self, min_x, min_y, width, height):
+        # copy of any rectangle, cells never written hold the default
+        cells = np.full((height, width), self.default_code, dtype=np.uint8)
+        grid_height, grid_width = self.cells.shape
+
+        x0 = max(min_x, self.origin_x)
+        x1 = min(min_x + width, self.origin_x + grid_width)
+        y0 = max(min_y, self.origin_y)
+        y1 = min(min_y + height, self.origin_y + grid_height)
+        if x0 < x1 and y0 < y1:
+            cells[y0 - min_y:y1 - min_y, x0 - min_x:x1 - min_x] = self.cells[
+                y0 - self.origin_y:y1 - self.origin_y,
+                x0 - self.origin_x:x1 - self.origin_x
+            ]
+
+        return cells
+
+    def count_neighbours4(self, value):
+        # for every cell of array(), how many of its 4 neighbours hold value
+        matches = np.pad(self.array() == self.encode(value), 1).astype(np.uint8)
+        return matches[:-2, 1:-1] + matches[2:, 1:-1] + matches[1:-1, :-2] + matches[1:-1, 2:]
+
+    def keys(self):
+        # every cell of the bounding box, like a defaultdict which has seen all of them
+        if self.bounds is None:
+            return
+        min_x, min_y, max_x, max_y = self.bounds
+        for y in range(min_y, max_y + 1):
+            for x in range(min_x, max_x + 1):
+                yield Point(x, y)
+
+    def __iter__(self):
+        return self.keys()
+
+    def items(self):
+        for p in self.keys():
+            yield p, self.get(p.x, p.y)
+
+    def to_dict(self):
+        return {p: value for p, value in self.items() if value != self.default}
+
+    @staticmethod
+    def from_dict(board, default=0):
+        grid = Grid(default)
+        for p, value in board.items():
+            grid[p] = value
+        return grid
@@ -0,0 +1,45 @@
+import numpy as np
+
+
+NEWLINE = ord("\n")
+
+
+def lookup_table(palette):
+    # codes not in the palette are drawn as the character with that code
+    table = np.arange(256, dtype=np.uint8)
+    for value, char in palette.items():
+        code = ord(value) if isinstance(value, str) else value
+        table[code] = ord(char)
+    return table
+
+
+def frame_bytes(cells, palette=None, flip=False):
+    if flip:
+        cells = cells[::-1]  # y grows upwards, first row printed is the highest one
+
+    height, width = cells.shape
+    frame = np.full((height, width + 1), NEWLINE, dtype=np.uint8)
+    frame[:, :width] = lookup_table(palette or {})[cells]
+    return frame.tobytes()[:-1]
+
+
+def render(cells, palette=None, flip=False, rle=False):
+    frame = frame_bytes(cells, palette, flip)
+    if rle:
+        return compress(frame)
+    return frame.decode('latin-1')
+
+
+def compress(frame):
+    # (char, count) for every run of one character, newlines included
+    if not frame:
+        return []
+
+    data = np.frombuffer(frame, dtype=np.uint8)
+    starts = np.flatnonzero(np.concatenate(([True], data[1:] != data[:-1])))
+    counts = np.diff(np.append(starts, len(data)))
+    return [(chr(data[start]), int(count)) for start, count in zip(starts, counts)]
+
+
+def expand(runs):
+    return "".join(char * count for char, count in runs)
@@ -1,6 +1,7 @@
 from int_computer import Computer, Queue
 from point import Point
-from collections import defaultdict as dd
+from grid import Grid
+from render import render
 
 import numpy as np
 
@@ -12,44 +13,31 @@ class Laser:
     UNKNOWN = ' '
 
     def __init__(self, tape):
-        self.in_queue = Queue(name="in")
-        self.out_queue = Queue(name="out")
-        self.tape = tape
-        self.points = dd(lambda: Laser.UNKNOWN)
+        self.computer = Computer(inq=Queue(name="in"), outq=Queue(name="out"))
+        self.computer.load(tape)
+        self.points = Grid(Laser.UNKNOWN)
 
     def get_info(self, p):
         current_knowlage = self.points[p]
         if current_knowlage != Laser.UNKNOWN:
             return current_knowlage
 
-        computer = Computer(inq=self.in_queue, outq=self.out_queue)
-        computer.load(self.tape)
+        # every probe starts from the same freshly loaded program, fork shares its pages
+        computer = self.computer.fork()
 
-        self.in_queue.put_message(p.x)
-        self.in_queue.put_message(p.y)
+        computer.inq.put_message(p.x)
+        computer.inq.put_message(p.y)
         computer.run()
 
-        res = self.out_queue.get_message()
+        res = computer.outq.get_message()
         symbol = Laser.LASER if res else Laser.EMPTY
         self.points[p] = symbol
 
         return symbol
 
     def display(self):
-        max_x = max(self.points, key=lambda x: x.x).x
-        max_y = max(self.points, key=lambda x: x.y).y
-
-        rows = []
-
-        for y in range(max_y):
-            row = []
-            for x in range(max_x):
-                row.append(str(self.points[Point(x, y)]))
-            rows.append(row)
-
-        image = "\n".join(map(lambda x: "".join(x), rows))
-
-        print(image)
+        _, _, max_x, max_y = self.points.bounds
+        print(render(self.points.region(0, 0, max_x, max_y)))
 
     def find_borders(self, iters, start_point=None):
         if not start_point:
@@ -0,0 +1,114 @@
+from point import Point
+from search import Board, bfs
+from collections import deque, defaultdict as dd
+
+import re
+import time
+
+
+def read_maze():
+    found = re.search(r"^maze = '''(.*?)'''", open('solution.py').read(), re.M | re.S)
+    return found.group(1).split("\n")
+
+
+def find_portals(rows):
+    # name -> open cells next to it, letters are read left to right and top to bottom
+    portals = dd(list)
+    for y in range(2, len(rows) - 2):
+        for x in range(2, len(rows[y]) - 2):
+            if rows[y][x] != '.':
+                continue
+            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+                first, second = rows[y + dy][x + dx], rows[y + 2 * dy][x + 2 * dx]
+                if first.isalpha():
+                    name = first + second if dx + dy > 0 else second + first
+                    portals[name].append(Point(x, y))
+    return portals
+
+
+def legacy_path(rows, portals, recursive):
+    # hand rolled bfs as the day had it, LVL_UP marker and (point, level) states in a set
+    height, width = len(rows), len(rows[0])
+    links = {}
+    for fields in portals.values():
+        if len(fields) == 2:
+            links[fields[0]], links[fields[1]] = fields[1], fields[0]
+
+    def is_outer(p):
+        return p.x == 2 or p.x == width - 3 or p.y == 2 or p.y == height - 3
+
+    def neighbours(p, level):
+        potential = [Point(p.x, p.y + 1), Point(p.x, p.y - 1), Point(p.x - 1, p.y), Point(p.x + 1, p.y)]
+        steps = [(n, level) for n in potential if rows[n.y][n.x] == '.']
+        if p in links:
+            new_level = level + (-1 if is_outer(p) else 1) if recursive else level
+            if new_level >= 0:
+                steps.append((links[p], new_level))
+        return steps
+
+    visited = set()
+    to_visit = deque([(portals['AA'][0], 0), 'LVL_UP'])
+    target = (portals['ZZ'][0], 0)
+    dist = 0
+
+    while len(to_visit) > 1:
+        current = to_visit.popleft()
+        visited.add(current)
+
+        if current == 'LVL_UP':
+            dist += 1
+            to_visit.append('LVL_UP')
+            continue
+        if current == target:
+            return dist
+
+        to_visit += deque([n for n in neighbours(*current) if n not in visited])
+
+
+def search_path(rows, portals, recursive):
+    height, width = len(rows), len(rows[0])
+    board = Board.from_rows(rows, lambda cells: cells == ord('.'))
+    size = board.size
+
+    teleports = {}
+    for fields in portals.values():
+        if len(fields) != 2:
+            continue
+        for p, q in [fields, fields[::-1]]:
+            outer = p.x == 2 or p.x == width - 3 or p.y == 2 or p.y == height - 3
+            level_change = (-size if outer else size) if recursive else 0
+            teleports[board.cell(p.x, p.y)] = (board.cell(q.x, q.y), level_change)
+
+    def neighbours(state):
+        cell = state % size
+        level = state - cell
+        steps = [level + n for n in board.neighbours(cell)]
+        if cell in teleports:
+            target, level_change = teleports[cell]
+            if level + level_change >= 0:
+                steps.append(level + level_change + target)
+        return steps
+
+    start, target = portals['AA'][0], portals['ZZ'][0]
+    start, target = board.cell(start.x, start.y), board.cell(target.x, target.y)
+    return bfs([start], neighbours, size, targets=[target]).distance(target)
+
+
+def benchmark():
+    rows = read_maze()
+    portals = find_portals(rows)
+
+    for recursive in [False, True]:
+        name = "recursive levels" if recursive else "flat maze"
+        times = []
+        results = []
+        for f in [legacy_path, search_path]:
+            start = time.perf_counter()
+            results.append(f(rows, portals, recursive))
+            times.append(time.perf_counter() - start)
+
+        assert results[0] == results[1]
+        print(f"{name:>16}: {results[1]} steps, {times[0]:.3f}s before, {times[1]:.3f}s after, {times[0] / times[1]:.1f}x")
+
+
+benchmark()
@@ -1,5 +1,7 @@
-from collections import deque, defaultdict as dd
+from collections import defaultdict as dd
 from point import Point
+from grid import Grid
+from search import Board, bfs
 
 
 class Maze():
@@ -10,7 +12,7 @@ class Maze():
 
     def __init__(self, inp):
         rows = inp.split("\n")
-        self.board = dd(lambda: Maze.UNKNOWN)
+        self.board = Grid(Maze.UNKNOWN)
         self.teleports = dd(lambda: [])
 
         for y in range(len(rows)):
@@ -89,38 +91,27 @@ class Maze():
 
         return list(filter(lambda x: self.board[x] != Maze.WALL, potential))
 
-    def get_all_neighbours(self, point):
-        steps = self.get_neighbours(point)
-        steps = list(filter(lambda x: self.board[x] == Maze.EMPTY, steps))
-        if point in self.zium:
-            return steps + [self.zium[point]]
-        return steps
+    def search_board(self):
+        return Board(self.board.array(), lambda cells: cells == ord(Maze.EMPTY))
 
     def find_path(self):
-        visited = set()
-        # print(self.teleports['AA'][0])
-        to_visit = deque(self.teleports['AA'] + ['LVL_UP'])
-        dist = 0
-
-        target = self.teleports['ZZ'][0]
-
-        while len(to_visit) > 1:
-            current = to_visit.popleft()
-            # print(current)
-            # print(dist)
-            visited.add(current)
-
-            if current == 'LVL_UP':
-                dist += 1
-                to_visit.append('LVL_UP')
-                continue
+        board = self.search_board()
+        teleports = {board.cell(p.x, p.y): board.cell(q.x, q.y) for p, q in self.zium.items()}
+
+        def neighbours(cell):
+            steps = board.neighbours(cell)
+            if cell in teleports:
+                steps.append(teleports[cell])
+            return steps
 
-            if current == target:
-                return dist
+        start, target = self.teleports['AA'][0], self.teleports['ZZ'][0]
+        start, target = board.cell(start.x, start.y), board.cell(target.x, target.y)
 
-            to_visit += deque([n for n in self.get_all_neighbours(current) if n not in visited])
+        dist = bfs([start], neighbours, board.size, targets=[target]).distance(target)
+        if dist is None:
+            raise Exception('Failed to reach ZZ')
 
-        raise Exception('Failed to reach ZZ')
+        return dist
 
 
 def solve(inp):
@@ -1,5 +1,7 @@
-from collections import deque, defaultdict as dd
+from collections import defaultdict as dd
 from point import Point
+from grid import Grid
+from search import Board, bfs
 
 
 class Maze():
@@ -10,7 +12,7 @@ class Maze():
 
     def __init__(self, inp):
         rows = inp.split("\n")
-        self.board = dd(lambda: Maze.UNKNOWN)
+        self.board = Grid(Maze.UNKNOWN)
         self.teleports = dd(lambda: [])
 
         self.height = len(rows)
@@ -95,41 +97,38 @@ class Maze():
     def is_outer_tlp(self, p):
         return p.x == 2 or p.x == self.width - 3 or p.y == 2 or p.y == self.height - 3
 
-    def get_all_neighbours(self, point, level):
-        steps = self.get_neighbours(point)
-        steps = list(filter(lambda x: self.board[x] == Maze.EMPTY, steps))
-        steps = list(map(lambda x: (x, level), steps))
-        if point in self.zium:
-            level_modifier = -1 if self.is_outer_tlp(point) else 1
-            if level + level_modifier >= 0:
-                steps.append((self.zium[point], level + level_modifier))
-        return steps
+    def search_board(self):
+        return Board(self.board.array(), lambda cells: cells == ord(Maze.EMPTY))
 
     def find_path(self):
-        visited = set()
         print(self.teleports['AA'][0])
-        to_visit = deque([(self.teleports['AA'][0], 0), 'LVL_UP'])
-        dist = 0
-
-        target = (self.teleports['ZZ'][0], 0)
-
-        while len(to_visit) > 1:
-            current = to_visit.popleft()
-            # print(current)
-            # print(dist)
-            visited.add(current)
-
-            if current == 'LVL_UP':
-                dist += 1
-                to_visit.append('LVL_UP')
-                continue
-
-            if current == target:
-                return dist
-
-            to_visit += deque([n for n in self.get_all_neighbours(current[0], current[1]) if n not in visited])
-
-        raise Exception('Failed to reach (ZZ, 0)')
+        board = self.search_board()
+        size = board.size
+
+        # state is level * size + cell, teleport keeps the cell and changes the level
+        teleports = {}
+        for p, q in self.zium.items():
+            level_modifier = -1 if self.is_outer_tlp(p) else 1
+            teleports[board.cell(p.x, p.y)] = (board.cell(q.x, q.y), level_modifier * size)
+
+        def neighbours(state):
+            cell = state % size
+            level = state - cell
+            steps = [level + n for n in board.neighbours(cell)]
+            if cell in teleports:
+                target, level_change = teleports[cell]
+                if level + level_change >= 0:
+                    steps.append(level + level_change + target)
+            return steps
+
+        start, target = self.teleports['AA'][0], self.teleports['ZZ'][0]
+        start, target = board.cell(start.x, start.y), board.cell(target.x, target.y)
+
+        dist = bfs([start], neighbours, size, targets=[target]).distance(target)
+        if dist is None:
+            raise Exception('Failed to reach (ZZ, 0)')
+
+        return dist
 
 
 def solve(inp):
@@ -1,25 +1,20 @@
-from int_computer import Computer, Queue
+from int_computer import Computer, AsciiQueue
 
 
 def print_message(queue):
     while not queue.is_empty():
-        message = queue.get_message()
-        if message < 255:
-            print(chr(message), end='')
-        else:
-            print("Big value:", message)
+        print(queue.get_text(), end='')
+        if not queue.is_empty():
+            print("Big value:", queue.get_message())
 
 
 def put_instruction(queue, instruction):
-    for c in instruction:
-        queue.put_message(ord(c))
-
-    queue.put_message(ord("\n"))
+    queue.put_line(instruction)
 
 
 def solve(tape):
-    in_queue = Queue(name="in")
-    out_queue = Queue(name="out")
+    in_queue = AsciiQueue(name="in")
+    out_queue = AsciiQueue(name="out")
     computer = Computer(inq=in_queue, outq=out_queue)
     computer.load(tape)
 
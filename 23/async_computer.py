@@ -0,0 +1,49 @@
+from int_computer import Computer, Queue
+
+import asyncio
+
+
+class Channel(Queue):
+    def __init__(self, name=None):
+        super().__init__(name=name)
+        self.ready = asyncio.Event()
+
+    def put_message(self, message):
+        super().put_message(message)
+        self.ready.set()
+
+    def copy(self):
+        channel = type(self)(name=self.name)
+        channel.q = self.q.copy()
+        return channel
+
+    def assign(self, other):
+        super().assign(other)
+        if self.q:
+            self.ready.set()
+
+    async def wait(self, count=1):
+        while len(self.q) < count:
+            self.ready.clear()
+            await self.ready.wait()
+
+
+class AsyncComputer(Computer):
+
+    async def run_until_halted(self, max_steps=None):
+        while True:
+            reason = self.run(max_steps=max_steps)
+            if reason == Computer.HALTED:
+                return
+
+            if reason == Computer.BUDGET:
+                # used up its time slice, let other tasks run
+                await asyncio.sleep(0)
+                continue
+
+            # paused on empty input, not scheduled again until someone writes to it
+            await self.inq.wait()
+
+    @staticmethod
+    async def run_all(computers):
+        await asyncio.gather(*[c.run_until_halted() for c in computers])
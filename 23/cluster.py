@@ -0,0 +1,311 @@
+from int_computer import Computer, Queue
+from scheduler import NetworkScheduler
+
+from multiprocessing import Process, shared_memory
+
+import os
+import time
+
+
+class Cells:
+    # int64 cells in shared memory, visible to every process which knows the name
+    def __init__(self, size, name=None):
+        self.shm = shared_memory.SharedMemory(name=name, create=name is None, size=8 * size)
+        self.name = self.shm.name
+        self.cells = self.shm.buf.cast('q')
+
+    def __getitem__(self, idx):
+        return self.cells[idx]
+
+    def __setitem__(self, idx, value):
+        self.cells[idx] = value
+
+    def close(self):
+        self.cells.release()
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+
+class Ring:
+    # packets from exactly one process to exactly one other, head moved by the writer, tail by the reader
+    HEAD = 0
+    TAIL = 1
+    HEADER = 2
+    PACKET = 3
+
+    def __init__(self, capacity, name=None):
+        self.capacity = capacity
+        self.cells = Cells(Ring.HEADER + capacity * Ring.PACKET, name=name)
+        self.name = self.cells.name
+
+    def put(self, packet):
+        cells = self.cells
+        head = cells[Ring.HEAD]
+        if head - cells[Ring.TAIL] == self.capacity:
+            return False
+
+        base = Ring.HEADER + (head % self.capacity) * Ring.PACKET
+        for idx, value in enumerate(packet):
+            cells[base + idx] = value
+        # packet is complete before the reader can see it
+        cells[Ring.HEAD] = head + 1
+        return True
+
+    def get(self):
+        cells = self.cells
+        tail = cells[Ring.TAIL]
+        if tail == cells[Ring.HEAD]:
+            return None
+
+        base = Ring.HEADER + (tail % self.capacity) * Ring.PACKET
+        packet = (cells[base], cells[base + 1], cells[base + 2])
+        cells[Ring.TAIL] = tail + 1
+        return packet
+
+    def close(self):
+        self.cells.close()
+
+    def unlink(self):
+        self.cells.unlink()
+
+
+class Status:
+    # global flags followed by a row of counters for every worker
+    GO = 0
+    STOP = 1
+    GLOBAL = 2
+
+    READY = 0
+    IDLE = 1
+    SENT = 2
+    RECEIVED = 3
+    FIELDS = 4
+
+    def __init__(self, workers, name=None):
+        self.workers = workers
+        self.cells = Cells(Status.GLOBAL + workers * Status.FIELDS, name=name)
+        self.name = self.cells.name
+
+    def get(self, worker, field):
+        return self.cells[Status.GLOBAL + worker * Status.FIELDS + field]
+
+    def set(self, worker, field, value):
+        self.cells[Status.GLOBAL + worker * Status.FIELDS + field] = value
+
+    def snapshot(self):
+        return [self.cells[idx] for idx in range(Status.GLOBAL, Status.GLOBAL + self.workers * Status.FIELDS)]
+
+    def close(self):
+        self.cells.close()
+
+    def unlink(self):
+        self.cells.unlink()
+
+
+class Node:
+    # one end of the cluster, sends to and receives from every other node over its own rings
+    # Worker and Cluster each define deliver for the packets which reach them
+    NAT_ADDR = 255
+
+    def __init__(self, idx, workers, ring_names, capacity):
+        self.idx = idx
+        self.workers = workers
+        self.coordinator = workers  # coordinator is the last node
+        self.inbound = [Ring(capacity, name=names[idx]) for names in ring_names if names[idx] is not None]
+        self.outbound = [Ring(capacity, name=name) if name is not None else None for name in ring_names[idx]]
+        self.sent = 0
+        self.received = 0
+
+    def node_of(self, address):
+        if address == Node.NAT_ADDR:
+            return self.coordinator
+        return address % self.workers
+
+    def send(self, packet):
+        node = self.node_of(packet[0])
+        if node == self.idx:
+            self.sent += 1
+            self.received += 1
+            self.deliver(packet)
+            return
+
+        ring = self.outbound[node]
+        while not ring.put(packet):
+            # receiver may be blocked on sending to us, keep our side moving
+            self.receive()
+        self.sent += 1
+
+    def receive(self):
+        for ring in self.inbound:
+            while (packet := ring.get()) is not None:
+                self.received += 1
+                self.deliver(packet)
+
+    def close(self):
+        for ring in self.inbound + [ring for ring in self.outbound if ring is not None]:
+            ring.close()
+
+
+class Worker(Node):
+    IDLE_SLEEP = 0.0001
+
+    def __init__(self, idx, workers, machines, tape, ring_names, status_name, capacity):
+        super().__init__(idx, workers, ring_names, capacity)
+        self.status = Status(workers, name=status_name)
+        self.addresses = list(range(idx, machines, workers))
+        self.local = {address: local_idx for local_idx, address in enumerate(self.addresses)}
+
+        computers = []
+        for address in self.addresses:
+            in_queue = Queue(name=f"in-{address}")
+            in_queue.put_message(address)
+            computer = Computer(inq=in_queue, outq=Queue(name=f"out-{address}"))
+            computer.load(tape)
+            computers.append(computer)
+        self.scheduler = NetworkScheduler(computers)
+
+    def deliver(self, packet):
+        # busy before the packet is counted, so a count which matches the senders never meets a stale idle flag
+        self.status.set(self.idx, Status.IDLE, 0)
+        address, x, y = packet
+        self.scheduler.deliver(self.local[address], x, y)
+
+    def publish(self):
+        self.status.set(self.idx, Status.RECEIVED, self.received)
+        self.status.set(self.idx, Status.SENT, self.sent)
+
+    def run(self):
+        status = self.status
+        status.set(self.idx, Status.READY, 1)
+        while not status.cells[Status.GO]:
+            time.sleep(Worker.IDLE_SLEEP)
+
+        while not status.cells[Status.STOP]:
+            self.receive()
+
+            if self.scheduler.runnable:
+                status.set(self.idx, Status.IDLE, 0)
+                for address, x, y in self.scheduler.run_next():
+                    self.send((address, x, y))
+                self.publish()
+                continue
+
+            self.publish()
+            status.set(self.idx, Status.IDLE, 1)
+            time.sleep(Worker.IDLE_SLEEP)
+
+        self.status.close()
+        self.close()
+
+
+def start_worker(*args):
+    Worker(*args).run()
+
+
+class Cluster(Node):
+    # coordinator, plays the NAT and decides when the whole network is idle
+
+    def __init__(self, tape, machines=50, workers=None, capacity=1024):
+        workers = min(workers or os.cpu_count() or 1, machines)
+        nodes = workers + 1
+
+        rings = [[Ring(capacity) if src != dst else None for dst in range(nodes)] for src in range(nodes)]
+        ring_names = [[ring.name if ring is not None else None for ring in row] for row in rings]
+        super().__init__(workers, workers, ring_names, capacity)
+
+        self.rings = [ring for row in rings for ring in row if ring is not None]
+        self.status = Status(workers)
+        self.processes = [
+            Process(target=start_worker, args=(idx, workers, machines, tape, ring_names, self.status.name, capacity))
+            for idx in range(workers)
+        ]
+
+        self.nat_packet = None
+        self.first_nat_y = None
+        self.packets = 0
+        self.elapsed = None
+
+    def deliver(self, packet):
+        _, x, y = packet
+        self.nat_packet = (x, y)
+        if self.first_nat_y is None:
+            self.first_nat_y = y
+
+    def idle_snapshot(self):
+        snapshot = self.status.snapshot()
+        rows = [snapshot[idx:idx + Status.FIELDS] for idx in range(0, len(snapshot), Status.FIELDS)]
+
+        if not all(row[Status.IDLE] for row in rows):
+            return None
+
+        sent = self.sent + sum(row[Status.SENT] for row in rows)
+        received = self.received + sum(row[Status.RECEIVED] for row in rows)
+        if sent != received:
+            return None
+
+        return snapshot + [self.sent, self.received]
+
+    def check_workers(self):
+        for process in self.processes:
+            if process.exitcode is not None:
+                raise Exception("worker stopped", process.name, process.exitcode)
+
+    def wait(self):
+        self.check_workers()
+        time.sleep(Worker.IDLE_SLEEP)
+
+    def run(self):
+        for process in self.processes:
+            process.start()
+
+        try:
+            return self.run_network()
+        finally:
+            self.shutdown()
+
+    def run_network(self):
+        while not all(self.status.get(idx, Status.READY) for idx in range(self.workers)):
+            self.wait()
+
+        start = time.perf_counter()
+        self.status.cells[Status.GO] = 1
+
+        previous_nat_y = None
+        previous_snapshot = None
+
+        while True:
+            self.receive()
+
+            # same idle state seen twice in a row, nothing was in flight in between
+            snapshot = self.idle_snapshot()
+            if snapshot is None or snapshot != previous_snapshot or self.nat_packet is None:
+                previous_snapshot = snapshot
+                self.wait()
+                continue
+
+            x, y = self.nat_packet
+            if previous_nat_y == y:
+                break
+
+            self.send((0, x, y))
+            previous_nat_y = y
+            previous_snapshot = None
+
+        self.elapsed = time.perf_counter() - start
+        self.packets = self.sent + sum(self.status.get(idx, Status.SENT) for idx in range(self.workers))
+
+        return self.first_nat_y, previous_nat_y
+
+    def shutdown(self):
+        self.status.cells[Status.STOP] = 1
+        for process in self.processes:
+            process.join()
+
+        self.close()
+        self.status.close()
+        self.status.unlink()
+        for ring in self.rings:
+            ring.close()
+            ring.unlink()
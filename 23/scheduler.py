@@ -0,0 +1,71 @@
+from collections import deque
+
+
+class NetworkScheduler:
+    NO_MESSAGE = -1
+    IDLE_READS = 2  # empty reads in a row, without sending anything, after which a machine is idle
+
+    def __init__(self, computers):
+        self.computers = computers
+        self.runnable = deque(range(len(computers)))
+        self.queued = set(self.runnable)
+        self.idle = set()
+        self.empty_reads = [0] * len(computers)
+
+    def wake(self, idx):
+        self.empty_reads[idx] = 0
+        self.idle.discard(idx)
+        if idx not in self.queued:
+            self.queued.add(idx)
+            self.runnable.append(idx)
+
+    def deliver(self, idx, x, y):
+        inq = self.computers[idx].inq
+        inq.put_message(x)
+        inq.put_message(y)
+        self.wake(idx)
+
+    def is_idle(self):
+        return len(self.idle) == len(self.computers)
+
+    def run_next(self):
+        idx = self.runnable.popleft()
+        self.queued.discard(idx)
+
+        computer = self.computers[idx]
+        inq = computer.inq
+        outq = computer.outq
+
+        no_packet = inq.is_empty()
+        if no_packet:
+            inq.put_message(NetworkScheduler.NO_MESSAGE)
+
+        computer.run()
+
+        packets = []
+        while not outq.is_empty():
+            address = outq.get_message()
+            x = outq.get_message()
+            y = outq.get_message()
+            packets.append((address, x, y))
+
+        if no_packet and not packets:
+            self.empty_reads[idx] += 1
+        else:
+            self.empty_reads[idx] = 0
+
+        if self.empty_reads[idx] >= NetworkScheduler.IDLE_READS:
+            self.idle.add(idx)
+        else:
+            self.queued.add(idx)
+            self.runnable.append(idx)
+
+        return packets
+
+    def run_until_idle(self):
+        while self.runnable:
+            for address, x, y in self.run_next():
+                yield address, x, y
+
+    def instructions(self):
+        return [computer.steps for computer in self.computers]
@@ -1,5 +1,8 @@
 from point import Point
-from collections import defaultdict as dd
+from grid import Grid
+from render import render
+
+import numpy as np
 
 
 class Bugs():
@@ -9,7 +12,7 @@ class Bugs():
 
     def __init__(self, inp):
         rows = inp.split()
-        self.board = dd(lambda: Bugs.EMPTY)
+        self.board = Grid(Bugs.EMPTY)
         self.width = len(rows[0])
         self.height = len(rows)
 
@@ -19,16 +22,6 @@ class Bugs():
                 point = Point(x, y)
                 self.board[point] = value
 
-    def get_neighbours_num(self, p):
-        potential = [
-            Point(p.x, p.y + 1),
-            Point(p.x, p.y - 1),
-            Point(p.x - 1, p.y),
-            Point(p.x + 1, p.y)
-        ]
-
-        return len(list(filter(lambda x: self.board[x] == Bugs.BUG, potential)))
-
     def rating(self):
         rating = 0
 
@@ -41,36 +34,21 @@ class Bugs():
         return rating
 
     def evolve(self):
-        evolution = dd(lambda: 0)
+        # neighbour counts of the whole board at once, from shifted views of the array
+        neighbours = self.board.count_neighbours4(Bugs.BUG)
+        cells = self.board.array()
+        bug = self.board.encode(Bugs.BUG)
+        empty = self.board.encode(Bugs.EMPTY)
 
-        for x in range(self.width):
-            for y in range(self.height):
-                p = Point(x, y)
-                evolution[p] = self.get_neighbours_num(p)
+        if not np.isin(cells, [bug, empty]).all():
+            raise Exception('Wrong walue in board')
 
-        for x in range(self.width):
-            for y in range(self.height):
-                p = Point(x, y)
-                num_of_neighbours = evolution[p]
-                if self.board[p] == Bugs.BUG:
-                    self.board[p] = Bugs.BUG if num_of_neighbours == 1 else Bugs.EMPTY
-                elif self.board[p] == Bugs.EMPTY:
-                    self.board[p] = Bugs.BUG if num_of_neighbours in [1, 2] else Bugs.EMPTY
-                else:
-                    raise Exception('Wrong walue in board')
+        survives = (cells == bug) & (neighbours == 1)
+        born = (cells == empty) & ((neighbours == 1) | (neighbours == 2))
+        cells[:] = np.where(survives | born, bug, empty)
 
     def display(self):
-        rows = []
-
-        for y in range(self.height):
-            row = []
-            for x in range(self.width):
-                row.append(str(self.board[Point(x, y)]))
-            rows.append(row)
-
-        image = "\n".join(map(lambda x: "".join(x), rows))
-
-        print(image)
+        print(render(self.board.array()))
 
 
 def solve(inp):
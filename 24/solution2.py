@@ -1,6 +1,9 @@
 from point import Point
+from render import render
 from collections import defaultdict as dd
 
+import numpy as np
+
 
 class Bugs():
 
@@ -93,21 +96,12 @@ class Bugs():
         return sum([1 for val in self.board.values() if val == Bugs.BUG])
 
     def display_level(self, level_nr):
-        level = dd(lambda: Bugs.EMPTY)
-        for (k, _), v in filter(lambda x: x[0][1] == level_nr, self.board.items()):
-            level[k] = v
-
-        rows = []
-
-        for y in range(5):
-            row = []
-            for x in range(5):
-                row.append(str(level[Point(x, y)]))
-            rows.append(row)
-
-        image = "\n".join(map(lambda x: "".join(x), rows))
+        cells = np.full((5, 5), ord(Bugs.EMPTY), dtype=np.uint8)
+        for (point, level), value in self.board.items():
+            if level == level_nr:
+                cells[point.y, point.x] = ord(value)
 
-        print(image)
+        print(render(cells))
 
 
 def solve(inp, time):
@@ -0,0 +1,116 @@
+from int_computer import Computer
+from collections import defaultdict as dd
+
+import json
+import math
+import time
+
+
+class Profiler:
+    HEAT = " .:-=+*#%@"
+    HEATMAP_WIDTH = 64
+
+    def __init__(self):
+        self.by_opcode = dd(int)
+        self.by_address = dd(int)
+        self.block_entries = dd(int)  # leader -> how many times block was entered
+        self.block_steps = dd(int)  # leader -> instructions executed in block
+        self.block_ends = {}
+        self.runs = []  # (seconds, instructions) for every run call
+
+    def execute(self, computer, max_steps=None):
+        by_opcode = self.by_opcode
+        by_address = self.by_address
+        block_entries = self.block_entries
+        block_steps = self.block_steps
+        block_ends = self.block_ends
+
+        steps = 0
+        leader = None
+        expected = None
+        start = time.perf_counter()
+
+        while computer.state == Computer.RUNNING:
+            if steps == max_steps:
+                computer.pause(Computer.BUDGET)
+                break
+
+            pointer = computer.pointer
+            operation = computer.get_operation()
+            operation.execute(computer)
+            steps += 1
+
+            if computer.state == Computer.PAUSED and computer.stop_reason == Computer.NEED_INPUT:
+                break  # input was not executed
+
+            # anything but falling through from the previous instruction starts a block
+            if pointer != expected:
+                leader = pointer
+                block_entries[leader] += 1
+            expected = pointer + operation.num_of_args + 1
+
+            by_opcode[type(operation).__name__] += 1
+            by_address[pointer] += 1
+            block_steps[leader] += 1
+            block_ends[leader] = max(block_ends.get(leader, pointer), pointer)
+
+        self.runs.append((time.perf_counter() - start, steps))
+        return steps
+
+    def top_blocks(self, n=10):
+        leaders = sorted(self.block_steps, key=lambda leader: -self.block_steps[leader])[:n]
+        return [{
+            'start': leader,
+            'end': self.block_ends[leader],
+            'entries': self.block_entries[leader],
+            'instructions': self.block_steps[leader],
+        } for leader in leaders]
+
+    def heatmap(self):
+        if not self.by_address:
+            return ""
+
+        width = Profiler.HEATMAP_WIDTH
+        last_row = max(self.by_address) // width
+        top = math.log(max(self.by_address.values()) + 1)
+
+        rows = []
+        for row in range(last_row + 1):
+            if not any(address in self.by_address for address in range(row * width, (row + 1) * width)):
+                continue
+
+            cells = []
+            for address in range(row * width, (row + 1) * width):
+                count = self.by_address.get(address, 0)
+                level = round(math.log(count + 1) / top * (len(Profiler.HEAT) - 1))
+                cells.append(Profiler.HEAT[level])
+            rows.append(f"{row * width:>6} |{''.join(cells)}|")
+
+        return "\n".join(rows)
+
+    def to_json(self, top=10):
+        return json.dumps({
+            'instructions': sum(self.by_opcode.values()),
+            'runs': [{'seconds': seconds, 'instructions': steps} for seconds, steps in self.runs],
+            'by_opcode': dict(self.by_opcode),
+            'by_address': {str(address): count for address, count in sorted(self.by_address.items())},
+            'top_blocks': self.top_blocks(top),
+        }, indent=2)
+
+    def report(self, top=10):
+        total = sum(self.by_opcode.values())
+        seconds = sum(seconds for seconds, _ in self.runs)
+        lines = [f"{total} instructions in {len(self.runs)} runs, {seconds:.3f}s", "", "by opcode:"]
+
+        for name, count in sorted(self.by_opcode.items(), key=lambda x: -x[1]):
+            lines.append(f"  {name:>20} {count:>10} {100 * count / total:6.2f}%")
+
+        lines += ["", f"top {top} blocks:"]
+        for block in self.top_blocks(top):
+            lines.append(
+                f"  {block['start']:>6}-{block['end']:<6} entered {block['entries']:>8}x,"
+                f" {block['instructions']:>10} instructions {100 * block['instructions'] / total:6.2f}%"
+            )
+
+        lines += ["", "heatmap:", self.heatmap()]
+        return "\n".join(lines)
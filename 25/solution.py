@@ -1,30 +1,21 @@
-from int_computer import Computer, Queue
+from int_computer import Computer, AsciiQueue
 from itertools import chain, combinations
 
 
 def printq(queue):
-    while not queue.is_empty():
-        print(chr(queue.get_message()), end='')
+    print(queue.get_text(), end='')
 
 
 def clearq(queue):
-    while not queue.is_empty():
-        queue.get_message()
+    queue.get_text()
 
 
 def get_all(queue):
-    res = []
-    while not queue.is_empty():
-        res.append(chr(queue.get_message()))
-
-    return ''.join(res)
+    return queue.get_text()
 
 
 def putline(queue, line):
-    for c in line:
-        queue.put_message(ord(c))
-
-    queue.put_message(ord("\n"))
+    queue.put_line(line)
 
 
 def get_commend(inp):
@@ -67,8 +58,8 @@ def run_smart_command(computer, command, condition):
 
 
 def solve(tape):
-    in_queue = Queue(name="in")
-    out_queue = Queue(name="out")
+    in_queue = AsciiQueue(name="in")
+    out_queue = AsciiQueue(name="out")
 
     computer = Computer(inq=in_queue, outq=out_queue)
     computer.load(tape)
@@ -0,0 +1,166 @@
+from int_computer import Computer, Memory
+
+from bisect import bisect_right
+
+import pickle
+import struct
+import zlib
+
+
+class TraceFile:
+    # records are: kind byte, payload length, zlib compressed pickle of the payload
+    HEADER = b'H'
+    CHECKPOINT = b'C'
+    INPUTS = b'I'
+
+    RECORD = struct.Struct('<cI')
+
+    @staticmethod
+    def write(f, kind, payload):
+        data = zlib.compress(pickle.dumps(payload, pickle.HIGHEST_PROTOCOL))
+        f.write(TraceFile.RECORD.pack(kind, len(data)))
+        f.write(data)
+
+    @staticmethod
+    def read(path):
+        with open(path, 'rb') as f:
+            while header := f.read(TraceFile.RECORD.size):
+                kind, length = TraceFile.RECORD.unpack(header)
+                data = f.read(length)
+                if len(data) < length:
+                    return  # cut short by a crash, everything before is usable
+                yield kind, pickle.loads(zlib.decompress(data))
+
+
+class RecordingComputer(Computer):
+    CHECKPOINT_INTERVAL = 100000
+
+    def load(self, tape):
+        super().load(tape)
+        self.source = tape
+        self.trace = None
+        self.inputs = []
+        self.inputs_count = 0
+        self.outputs_count = 0
+
+    def record(self, path, interval=CHECKPOINT_INTERVAL):
+        self.trace = open(path, 'wb')
+        self.interval = interval
+
+        TraceFile.write(self.trace, TraceFile.HEADER, {'tape': self.source, 'interval': interval})
+        self.checkpoint_trace()
+
+    def checkpoint_trace(self):
+        self.flush_inputs()
+        # only pages written since the previous checkpoint
+        pages = {}
+        for page_idx in self.tape.dirty_pages():
+            start = page_idx << Memory.PAGE_BITS
+            pages[page_idx] = self.tape[start:start + Memory.PAGE_SIZE]
+        self.tape.mark_clean()
+
+        TraceFile.write(self.trace, TraceFile.CHECKPOINT, {
+            'steps': self.steps,
+            'pointer': self.pointer,
+            'relative_base': self.relative_base,
+            'state': self.state,
+            'inputs': self.inputs_count,
+            'outputs': self.outputs_count,
+            'pages': pages,
+        })
+        self.next_checkpoint = self.steps + self.interval
+
+    def flush_inputs(self):
+        if self.inputs:
+            TraceFile.write(self.trace, TraceFile.INPUTS, self.inputs)
+            self.inputs = []
+        self.trace.flush()
+
+    def read(self):
+        value = super().read()
+        if self.trace is not None:
+            self.inputs.append(value)
+            self.inputs_count += 1
+        return value
+
+    def write(self, out):
+        self.outputs_count += 1
+        super().write(out)
+
+    def run(self, v=False, max_steps=None, max_outputs=None):
+        if self.trace is None:
+            return super().run(v=v, max_steps=max_steps, max_outputs=max_outputs)
+
+        start_steps = self.steps
+        start_outputs = self.outputs_count
+
+        while True:
+            # runs in slices ending at the next checkpoint, limits apply to the whole call
+            budget = self.next_checkpoint - self.steps
+            if max_steps is not None:
+                budget = min(budget, max_steps - (self.steps - start_steps))
+            outputs = None
+            if max_outputs:
+                outputs = max_outputs - (self.outputs_count - start_outputs)
+
+            reason = super().run(v=v, max_steps=budget, max_outputs=outputs)
+
+            if self.steps == self.next_checkpoint:
+                self.checkpoint_trace()
+            if reason != Computer.BUDGET or (max_steps is not None and self.steps - start_steps == max_steps):
+                break
+
+        self.flush_inputs()
+        return reason
+
+    def close_trace(self):
+        self.flush_inputs()
+        self.trace.close()
+        self.trace = None
+
+
+class Replayer:
+    def __init__(self, path):
+        self.checkpoints = []
+        self.inputs = []
+
+        for kind, payload in TraceFile.read(path):
+            if kind == TraceFile.HEADER:
+                self.tape = payload['tape']
+                self.interval = payload['interval']
+            elif kind == TraceFile.CHECKPOINT:
+                self.checkpoints.append(payload)
+            elif kind == TraceFile.INPUTS:
+                self.inputs += payload
+
+    def nearest_checkpoint(self, step):
+        steps = [checkpoint['steps'] for checkpoint in self.checkpoints]
+        return max(bisect_right(steps, step) - 1, 0)
+
+    def seek(self, step, computer_class=Computer):
+        idx = self.nearest_checkpoint(step)
+        checkpoint = self.checkpoints[idx]
+
+        # newest copy of every page written up to the checkpoint
+        pages = {}
+        for previous in self.checkpoints[:idx + 1]:
+            pages.update(previous['pages'])
+
+        computer = computer_class()
+        computer.load(self.tape)
+        for page_idx, page in pages.items():
+            start = page_idx << Memory.PAGE_BITS
+            for offset, value in enumerate(page):
+                computer.tape[start + offset] = value
+
+        computer.pointer = checkpoint['pointer']
+        computer.relative_base = checkpoint['relative_base']
+        computer.state = checkpoint['state']
+        computer.steps = checkpoint['steps']
+        for value in self.inputs[checkpoint['inputs']:]:
+            computer.inq.put_message(value)
+
+        if step > checkpoint['steps'] and computer.state != Computer.HALTED:
+            computer.run(max_steps=step - checkpoint['steps'])
+
+        return computer